@@ -6,6 +6,7 @@ from .assembler import assemble_auto
 from .assembler import clear_schema_cache
 from .parser import parse
 from .parser import parse_auto
+from .parser import parse_auto_many
 from .parser import validate_schema
 from .schema_registry import get_schema_path
 from .schema_registry import list_schema_families
@@ -38,6 +39,7 @@ def info() -> dict[str, str]:
 __all__ = [
     "parse",
     "parse_auto",
+    "parse_auto_many",
     "assemble",
     "assemble_auto",
     "clear_schema_cache",
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import math
+from types import MappingProxyType
 from typing import Optional
 
 
@@ -31,6 +33,17 @@ _MGRS_LATITUDE_BANDS = {
 }
 
 
+# EPSG code for every valid MGRS grid zone designation (zone + latitude band),
+# e.g. ``"32T" -> "32632"``.
+_MGRS_ZONE_EPSG = MappingProxyType(
+    {
+        f"{zone:02d}{band}": f"{(32600 if hemisphere == 'north' else 32700) + zone:05d}"
+        for zone in range(1, 61)
+        for band, hemisphere in _MGRS_LATITUDE_BANDS.items()
+    }
+)
+
+
 def mgrs_tile_to_epsg(tile: str) -> Optional[str]:
     """Return the EPSG code associated with a Sentinel-2 MGRS tile.
 
@@ -47,25 +60,17 @@ def mgrs_tile_to_epsg(tile: str) -> Optional[str]:
     if not tile.startswith("T"):
         return None
 
-    zone_part = tile[1:3]
+    epsg = _MGRS_ZONE_EPSG.get(tile[1:4])
+    if epsg is not None or len(tile) < 4:
+        return epsg
+
+    # Zones such as ``" 1"`` or ``"+1"`` miss the table but have always been
+    # accepted through ``int``; normalise them before retrying the lookup.
     try:
-        zone = int(zone_part)
+        zone = int(tile[1:3])
     except ValueError:
         return None
-    if not 1 <= zone <= 60:
-        return None
-
-    band = tile[3]
-    hemisphere = _MGRS_LATITUDE_BANDS.get(band)
-    if hemisphere is None:
-        return None
-
-    if hemisphere == "north":
-        epsg = 32600 + zone
-    else:
-        epsg = 32700 + zone
-
-    return f"{epsg:05d}"
+    return _MGRS_ZONE_EPSG.get(f"{zone:02d}{tile[3]}")
 
 
 @dataclass(frozen=True)
@@ -116,6 +121,13 @@ def landsat_path_row_to_epsg(path: str, row: str) -> Optional[str]:
     if not 1 <= row_num <= _WRS_CONSTANTS.rows:
         return None
 
+    return _wrs_epsg(path_num, row_num)
+
+
+@lru_cache(maxsize=4096)
+def _wrs_epsg(path_num: int, row_num: int) -> str:
+    """Return the EPSG code for a validated WRS-2 path/row pair."""
+
     longitude = _path_to_longitude(path_num)
     latitude = _row_to_latitude(row_num)
 
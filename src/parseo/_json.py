@@ -6,9 +6,32 @@ from typing import Any
 from typing import Dict
 from typing import Union
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON *data*, using :mod:`orjson` when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
 
 def load_json(path: Union[str, Path]) -> Dict[str, Any]:
     """Load a JSON file, handling optional UTF-8 BOM."""
-    p = Path(path)
-    text = p.read_text(encoding="utf-8-sig")
-    return json.loads(text)
+    raw = Path(path).read_bytes()
+    if raw.startswith(_UTF8_BOM):
+        raw = raw[len(_UTF8_BOM) :]
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (no NaN) and words its errors differently;
+            # let the stdlib decide so callers see its familiar messages.
+            pass
+    return json.loads(raw.decode("utf-8"))
@@ -2,8 +2,6 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from importlib.resources import as_file
-from importlib.resources import files
 from pathlib import Path
 import re
 from typing import Any
@@ -12,8 +10,11 @@ from typing import Union
 
 from ._field_mappings import translate_fields_to_tokens
 from ._json import load_json
+from .schema_registry import _get_schema_paths
+from .schema_registry import clear_cache
 from .schema_registry import get_schema_path
 from .template import _field_regex
+from .template import _tokenize
 from .template import compile_template
 
 
@@ -25,9 +26,16 @@ def _load_schema(schema_path: Union[str, Path]) -> Dict[str, Any]:
     return load_json(str(schema_path))
 
 
+@lru_cache(maxsize=512)
+def _field_validator(pattern: str) -> re.Pattern:
+    """Return the anchored regex that checks values against a field *pattern*."""
+    return re.compile(f"^{_field_regex({'pattern': pattern})}$")
+
+
 def clear_schema_cache() -> None:
-    """Clear the cached schemas."""
+    """Clear the cached schemas and every schema registry cache."""
     _load_schema.cache_clear()
+    clear_cache()
 
 
 def _assemble_from_template(template: str, fields: Dict[str, Any]) -> str:
@@ -37,39 +45,23 @@ def _assemble_from_template(template: str, fields: Dict[str, Any]) -> str:
     is missing. ``{field}`` placeholders are replaced by values from *fields*.
     """
 
-    def render(segment: str) -> str:
-        result = ""
-        i = 0
-        while i < len(segment):
-            ch = segment[i]
-            if ch == "{":
-                j = segment.index("}", i)
-                name = segment[i + 1 : j]
-                if name not in fields:
-                    raise KeyError(name)
-                result += str(fields[name])
-                i = j + 1
-            elif ch == "[":
-                depth = 1
-                j = i + 1
-                while j < len(segment) and depth:
-                    if segment[j] == "[":
-                        depth += 1
-                    elif segment[j] == "]":
-                        depth -= 1
-                    j += 1
-                inner = segment[i + 1 : j - 1]
+    def render(tokens: tuple) -> str:
+        parts: list[str] = []
+        for kind, value in tokens:
+            if kind == "field":
+                if value not in fields:
+                    raise KeyError(value)
+                parts.append(str(fields[value]))
+            elif kind == "optional":
                 try:
-                    result += render(inner)
+                    parts.append(render(value))
                 except KeyError:
                     pass
-                i = j
             else:
-                result += ch
-                i += 1
-        return result
+                parts.append(value)
+        return "".join(parts)
 
-    return render(template)
+    return render(_tokenize(template))
 
 
 def _assemble_schema(schema_path: Union[str, Path], fields: Dict[str, Any]) -> str:
@@ -106,9 +98,7 @@ def _assemble_schema(schema_path: Union[str, Path], fields: Dict[str, Any]) -> s
                 f"Field '{name}' must be one of {spec['enum']}, got {value!r}."
             )
         if "pattern" in spec:
-            pattern = _field_regex({"pattern": spec["pattern"]})
-            regex = re.compile(f"^{pattern}$")
-            if not regex.match(str(value)):
+            if not _field_validator(spec["pattern"]).match(str(value)):
                 raise ValueError(
                     f"Field '{name}' with value {value!r} does not match pattern {spec['pattern']}."
                 )
@@ -143,12 +133,13 @@ def assemble(
     return assemble_auto(fields)
 
 
-def _iter_schema_paths() -> list[Path]:
-    """Return all packaged schema JSON paths."""
-    base = files(__package__).joinpath(SCHEMAS_ROOT)
-    with as_file(base) as bp:
-        root = Path(bp)
-        return list(root.rglob("*.json"))
+def _iter_schema_paths() -> tuple[Path, ...]:
+    """Return all packaged ``*filename_v*.json`` schema paths.
+
+    The listing is shared with the schema registry's cache, so index and
+    auxiliary JSON files are not considered.
+    """
+    return tuple(_get_schema_paths(__package__))
 
 
 def _select_schema_by_first_compulsory(fields: Dict[str, Any]) -> Path:
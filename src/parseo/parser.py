@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import replace
 from functools import lru_cache
 from importlib.resources import as_file
 from importlib.resources import files
 from pathlib import Path
 import re
+import sys
 from typing import Any
 from typing import Dict
 from typing import Iterable
@@ -27,8 +29,11 @@ from .template import compile_template
 # Root folder inside the package where JSON schemas live
 SCHEMAS_ROOT = "schemas"
 
+# ``dataclass(slots=True)`` only exists on Python 3.10+.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class ParseResult:
     """Result of a parsing attempt."""
     valid: bool
@@ -103,21 +108,62 @@ def _match_filename(name: str, schema: Dict) -> Optional[re.Match]:
     return rx.match(name)
 
 
+# Matches a named-group opener so it can be turned into a plain group when
+# schema patterns are merged into one dispatch regex.
+_NAMED_GROUP_PATTERN = re.compile(r"(?<!\\)\(\?P<\w+>")
+
+
+@lru_cache(maxsize=8)
+def _combined_pattern(
+    candidates: tuple[Path, ...],
+) -> Optional[tuple[re.Pattern, tuple[Path, ...]]]:
+    """Return one regex matching any of *candidates* and the path per branch.
+
+    Each schema pattern becomes an alternative named ``_s<index>`` so a single
+    ``match`` finds the first matching schema in candidate order. Field names
+    are stripped from the branches; fields are extracted afterwards with the
+    winning schema's own pattern. Returns ``None`` if no combined regex can be
+    built, in which case callers fall back to trying schemas one by one.
+    """
+
+    branches: list[str] = []
+    paths: list[Path] = []
+    for p in candidates:
+        try:
+            patt = _pattern_from_schema(_load_json_from_path(p))
+        except Exception:
+            continue
+        if not isinstance(patt, str) or not patt:
+            continue
+        plain = _NAMED_GROUP_PATTERN.sub("(?:", patt)
+        branches.append(f"(?P<_s{len(paths)}>{plain})")
+        paths.append(p)
+    if not branches:
+        return None
+    try:
+        return re.compile("|".join(branches)), tuple(paths)
+    except re.error:
+        return None
+
+
 def _generate_name_variants(name: str) -> Iterator[str]:
     """Yield name variants accounting for known inconsistencies."""
 
     yield name
 
 
-def _family_from_path(path: Path, info: Dict[str, Any]) -> Optional[str]:
-    for fam_name, meta in info.items():
-        if getattr(meta, "schema_path", None) == path:
-            return fam_name
-        versions = getattr(meta, "versions", {})
-        for ver_path, _status in getattr(versions, "values", lambda: [])():
-            if ver_path == path:
-                return fam_name
-    return None
+@lru_cache(maxsize=8)
+def _schema_path_index(
+    pkg: str,
+) -> Dict[Path, tuple[str, Optional[str], Optional[str]]]:
+    """Map every schema path known for *pkg* to ``(family, version, status)``."""
+
+    index: Dict[Path, tuple[str, Optional[str], Optional[str]]] = {}
+    for fam_name, meta in _discover_family_info(pkg).items():
+        index.setdefault(meta.schema_path, (fam_name, meta.version, meta.status))
+        for ver, (path, st) in meta.versions.items():
+            index.setdefault(path, (fam_name, ver, st))
+    return index
 
 
 def _guess_product_family(name: str, info: Dict[str, Any]) -> Optional[str]:
@@ -163,11 +209,32 @@ def _try_validate(name: str, schema: Dict) -> bool:
     return _match_filename(name, schema) is not None
 
 
+def _result_for_path(
+    name: str,
+    path: Path,
+    schema: Dict,
+    index: Dict[Path, tuple[str, Optional[str], Optional[str]]],
+    product_hint: Optional[str],
+) -> ParseResult:
+    """Build the successful :class:`ParseResult` for *name* matched by *path*."""
+
+    matched_family, version, status = index.get(path, (None, None, None))
+    display_family = to_display_family(matched_family or product_hint)
+    return ParseResult(
+        valid=True,
+        fields=_extract_fields(name, schema),
+        version=version,
+        status=status,
+        match_family=display_family,
+    )
+
+
 def _attempt_parse(
     name: str,
     info: Dict[str, Any],
     candidates: Iterable[Path],
     product_hint: Optional[str],
+    index: Dict[Path, tuple[str, Optional[str], Optional[str]]],
 ) -> tuple[Optional[ParseResult], Optional[ParseError], Optional[Exception]]:
     """Attempt to parse *name* once and return result with diagnostics."""
 
@@ -176,38 +243,54 @@ def _attempt_parse(
 
     hinted_meta = info.get(product_hint) if product_hint else None
     hinted = hinted_meta.schema_path if hinted_meta else None
+    hinted_schema: Optional[Dict] = None
     if hinted and hinted.exists():
         try:
-            schema = _load_json_from_path(hinted)
-            canonical_family = product_hint or _family_from_path(hinted, info)
-            if _try_validate(name, schema):
-                display_family = to_display_family(canonical_family)
+            hinted_schema = _load_json_from_path(hinted)
+            if _try_validate(name, hinted_schema):
                 return (
                     ParseResult(
                         valid=True,
-                        fields=_extract_fields(name, schema),
-                        version=hinted_meta.version if hinted_meta else None,
-                        status=hinted_meta.status if hinted_meta else None,
-                        match_family=display_family,
+                        fields=_extract_fields(name, hinted_schema),
+                        version=hinted_meta.version,
+                        status=hinted_meta.status,
+                        match_family=to_display_family(product_hint),
                     ),
                     None,
                     None,
                 )
-            mismatch = _explain_match_failure(name, schema)
+        except Exception:
+            # If hinted schema is unreadable, fall back to brute force
+            hinted_schema = None
+
+    # Dispatch through the merged regex first; when it finds nothing the code
+    # below only runs to collect diagnostics for the error message.
+    candidates = tuple(candidates)
+    combined = _combined_pattern(candidates)
+    if combined is not None:
+        rx, paths = combined
+        m = rx.match(name)
+        if m is not None:
+            p = paths[int(m.lastgroup[2:])]
+            schema = _load_json_from_path(p)
+            return _result_for_path(name, p, schema, index, product_hint), None, None
+
+    # Nothing matched so far: explaining near misses is only worth the cost now.
+    if hinted_schema is not None:
+        try:
+            mismatch = _explain_match_failure(name, hinted_schema)
             if mismatch:
                 field, expected, value = mismatch
-                display_family = to_display_family(canonical_family)
                 near_miss = ParseError(
                     field,
                     expected,
                     value,
-                    schema_id=schema.get("schema_id"),
-                    match_family=display_family,
+                    schema_id=hinted_schema.get("schema_id"),
+                    match_family=to_display_family(product_hint),
                 )
         except ParseError as err:
             near_miss = err
         except Exception:
-            # If hinted schema is unreadable, fall back to brute force
             pass
 
     for p in candidates:
@@ -218,40 +301,12 @@ def _attempt_parse(
                 first_error = exc
             continue
         if _try_validate(name, schema):
-            matched_family = None
-            version = None
-            status = None
-            for fam_name, meta in info.items():
-                if meta.schema_path == p:
-                    matched_family = fam_name
-                    version = meta.version
-                    status = meta.status
-                    break
-                for ver, (path, st) in meta.versions.items():
-                    if path == p:
-                        matched_family = fam_name
-                        version = ver
-                        status = st
-                        break
-                if matched_family:
-                    break
-            display_family = to_display_family(matched_family or product_hint)
-            return (
-                ParseResult(
-                    valid=True,
-                    fields=_extract_fields(name, schema),
-                    version=version,
-                    status=status,
-                    match_family=display_family,
-                ),
-                None,
-                None,
-            )
+            return _result_for_path(name, p, schema, index, product_hint), None, None
         if near_miss is None:
             mismatch = _explain_match_failure(name, schema)
             if mismatch:
                 field, expected, value = mismatch
-                canonical_family = _family_from_path(p, info)
+                canonical_family = index.get(p, (None,))[0]
                 display_family = to_display_family(canonical_family or product_hint)
                 near_miss = ParseError(
                     field,
@@ -456,7 +511,7 @@ def _explain_match_failure(name: str, schema: Dict) -> Optional[tuple[str, str,
             start_pos = len(m_before.group(0)) if m_before else 0
             target_field = field
             spec = fields.get(target_field, {})
-            field_rx = re.compile(_field_regex(spec))
+            field_rx = _compile_pattern(_field_regex(spec))
             m_field = field_rx.match(name[start_pos:])
             if m_field and i + 1 < len(order):
                 next_field = order[i + 1]
@@ -471,7 +526,7 @@ def _explain_match_failure(name: str, schema: Dict) -> Optional[tuple[str, str,
                     start_pos = len(m_current_end.group(0)) if m_current_end else start_pos
                 target_field = next_field
                 spec = next_spec
-                field_rx = re.compile(_field_regex(spec))
+                field_rx = _compile_pattern(_field_regex(spec))
                 m_field = field_rx.match(name[start_pos:])
                 if m_field:
                     # Both the current and subsequent field values satisfy
@@ -645,6 +700,32 @@ def parse_auto(name: str) -> ParseResult:
     inspecting available schema files. Returns a ParseResult on success;
     raises RuntimeError if nothing matches.
     """
+    res = _parse_auto_cached(name)
+    # Hand out a private copy of the fields so callers cannot corrupt the cache.
+    return replace(res, fields=dict(res.fields))
+
+
+def parse_auto_many(names: Iterable[str]) -> list[ParseResult]:
+    """Parse every filename in *names* with :func:`parse_auto`.
+
+    Results are returned in input order. Repeated names are parsed only once
+    per call, however large the batch. Raises like :func:`parse_auto` on the
+    first name that no schema matches.
+    """
+    seen: Dict[str, ParseResult] = {}
+    results: list[ParseResult] = []
+    for name in names:
+        res = seen.get(name)
+        if res is None:
+            res = seen[name] = _parse_auto_cached(name)
+        results.append(replace(res, fields=dict(res.fields)))
+    return results
+
+
+# Successful matches are memoized per filename; failures raise and are not
+# cached.  ``schema_registry.clear_cache()`` resets this cache as well.
+@lru_cache(maxsize=1024)
+def _parse_auto_cached(name: str) -> ParseResult:
     pkg = __package__  # e.g., "parseo"
     info = _discover_family_info(pkg)
     candidates = _get_schema_paths(pkg)
@@ -658,7 +739,7 @@ def parse_auto(name: str) -> ParseResult:
     for candidate_name in _generate_name_variants(name):
         product_hint = _guess_product_family(candidate_name, info)
         result, attempt_near_miss, attempt_first_error = _attempt_parse(
-            candidate_name, info, candidates, product_hint
+            candidate_name, info, candidates, product_hint, _schema_path_index(pkg)
         )
         if result is not None:
             return result
@@ -667,10 +748,14 @@ def parse_auto(name: str) -> ParseResult:
         if first_error is None and attempt_first_error is not None:
             first_error = attempt_first_error
 
-    # Nothing matched — provide a helpful error listing what we saw
+    # Nothing matched — provide a helpful error listing what we saw.  Reuse
+    # the cached candidate list rather than walking the schema tree again.
     with as_file(files(pkg).joinpath(SCHEMAS_ROOT)) as rp:
         base = Path(rp)
-        seen = [str(q.relative_to(base)) for q in base.rglob("*filename_v*.json")] if base.exists() else []
+        seen = [
+            str(q.relative_to(base)) if q.is_relative_to(base) else str(q)
+            for q in candidates
+        ]
     msg = (
         "No schema matched the provided name. "
         f"Looked recursively under {pkg}/{SCHEMAS_ROOT}/ and found "
@@ -684,6 +769,14 @@ def parse_auto(name: str) -> ParseResult:
     raise RuntimeError(msg)
 
 
+def _clear_caches() -> None:
+    """Drop parser caches derived from the schema registry."""
+
+    _schema_path_index.cache_clear()
+    _combined_pattern.cache_clear()
+    _parse_auto_cached.cache_clear()
+
+
 def validate_schema(
     paths: Union[str, Path, Iterable[Union[str, Path]], None] = None,
     pkg: str = __package__,
@@ -711,6 +804,7 @@ def validate_schema(
     """
 
     _get_schema_paths.cache_clear()
+    _clear_caches()
     if paths is None:
         schema_paths = _get_schema_paths(pkg)
     elif isinstance(paths, (str, Path)):
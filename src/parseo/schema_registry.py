@@ -5,8 +5,10 @@ from dataclasses import field
 from functools import lru_cache
 from importlib.resources import as_file
 from importlib.resources import files
+import os
 from pathlib import Path
 import re
+import time
 from typing import Any
 from typing import Dict
 from typing import Iterator
@@ -25,6 +27,17 @@ _FAMILY_ALIASES: Dict[str, str] = {
 
 _FAMILY_SYNONYMS: Dict[str, str] = {v: k for k, v in _FAMILY_ALIASES.items()}
 
+_SENTINEL_FAMILY_PATTERN = re.compile(r"S(\d+)([A-Z]*)")
+
+# Decoded schema JSON per path, tagged with the file's (mtime_ns, size).  It
+# survives clear_cache() so rediscovery only re-decodes files that changed.
+_DECODED_JSON: Dict[str, tuple[int, int, Dict]] = {}
+
+# Files modified this recently could change again within the same timestamp
+# tick, so their decoded content is not kept (git treats such index entries
+# as "racily clean" for the same reason).
+_MTIME_SETTLE_NS = 2_000_000_000
+
 
 def _normalize_family_name(family: str) -> str:
     fam = family.upper()
@@ -41,7 +54,17 @@ def to_display_family(family: Optional[str]) -> Optional[str]:
 
 @lru_cache(maxsize=256)
 def _load_json_from_path(path: Path) -> Dict:
-    return load_json(path)
+    st = os.stat(path)
+    key = str(path)
+    entry = _DECODED_JSON.get(key)
+    if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+        return entry[2]
+    data = load_json(path)
+    if time.time_ns() - st.st_mtime_ns > _MTIME_SETTLE_NS:
+        _DECODED_JSON[key] = (st.st_mtime_ns, st.st_size, data)
+    else:
+        _DECODED_JSON.pop(key, None)
+    return data
 
 
 def _iter_schema_paths(pkg: str) -> Iterator[Path]:
@@ -51,7 +74,26 @@ def _iter_schema_paths(pkg: str) -> Iterator[Path]:
         base = Path(root_path)
         if not base.exists():
             return
-        yield from (p for p in base.rglob("*filename_v*.json") if p.is_file())
+        yield from _scan_schema_files(base)
+
+
+def _scan_schema_files(directory: Path) -> Iterator[Path]:
+    """Yield ``*filename_v*.json`` files below *directory*.
+
+    Uses :func:`os.scandir` so file types come from the directory listing
+    instead of one ``stat`` per path; hidden directories are skipped.
+    """
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                if not name.startswith("."):
+                    subdirs.append(entry.path)
+            elif "filename_v" in name and name.endswith(".json") and entry.is_file():
+                yield Path(entry.path)
+    for subdir in subdirs:
+        yield from _scan_schema_files(Path(subdir))
 
 
 @lru_cache(maxsize=32)
@@ -62,7 +104,7 @@ def _get_schema_paths(pkg: str) -> list[Path]:
 def _family_tokens_from_name(family: str) -> tuple[str, ...]:
     fam = family.upper()
     tokens = {fam}
-    m = re.fullmatch(r"S(\d+)([A-Z]*)", fam)
+    m = _SENTINEL_FAMILY_PATTERN.fullmatch(fam)
     if m:
         num, suffix = m.groups()
         tokens.add(f"SENTINEL-{num}{suffix}")
@@ -230,10 +272,26 @@ def clear_cache() -> None:
     """Clear internal caches used by the schema registry.
 
     This helper is primarily intended for tests that need to add or modify
-    schema files at runtime.
+    schema files at runtime. Decoded JSON is reused for files whose
+    modification time and size are unchanged; see :func:`clear_all`.
     """
 
     _load_json_from_path.cache_clear()
     _get_schema_paths.cache_clear()
     _discover_family_info.cache_clear()
     get_schema_path.cache_clear()
+
+    from .parser import _clear_caches  # local import to avoid cycle
+
+    _clear_caches()
+
+
+def clear_all() -> None:
+    """Clear every registry cache, including decoded schema files.
+
+    :func:`clear_cache` keeps decoded JSON for files whose modification time
+    and size are unchanged; use this when even that must be re-read.
+    """
+
+    _DECODED_JSON.clear()
+    clear_cache()
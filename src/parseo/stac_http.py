@@ -8,39 +8,196 @@ functions require explicitly passing the ``base_url`` of the STAC service.
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
 from functools import lru_cache
+import gzip
 import itertools
 import json
 from pathlib import Path
+import random
 import re
 from string import Template
+import time
 from typing import Union
 import urllib.error
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
 from urllib.parse import urljoin
 from urllib.parse import urlparse
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
 import urllib.request
 
+from ._json import loads
+
+# Upper bound on concurrent leaf-collection requests in
+# :func:`sample_collection_filenames`.
+_MAX_WORKERS = 16
+
+# Transient HTTP statuses retried by :func:`_read_json` with exponential
+# backoff (``_BACKOFF_FACTOR * 2 ** attempt`` seconds, fully jittered).
+_RETRY_STATUS = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 5
+_BACKOFF_FACTOR = 0.5
+# Longest server-requested ``Retry-After`` honoured, in seconds; longer waits
+# surface the HTTP error instead of blocking the caller.
+_MAX_RETRY_AFTER = 60.0
+
+_NON_ALNUM_PATTERN = re.compile(r"[^A-Za-z0-9]")
+# Template variables left unresolved after substitution (``$value`` is part of
+# OData download URLs, not a variable).
+_UNRESOLVED_VAR_PATTERN = re.compile(r"\$(?!value\b)\w+")
+_ODATA_PRODUCT_PATTERN = re.compile(r"Products\('([^']+)'\)")
+_UNSAFE_FILENAME_PATTERN = re.compile(r"[^A-Za-z0-9._-]")
+
+# Item fields requested from servers implementing the STAC API Fields
+# extension.  ``assets`` is requested whole because dotted paths address
+# literal keys, not every entry of the assets mapping.
+_ITEM_FIELDS = "properties,assets"
+
+
 def _norm_collection_id(collection_id: str, *, base_url: str) -> str:
     """Resolve ``collection_id`` to the official ID from the STAC API."""
 
-    norm = re.sub(r"[^A-Za-z0-9]", "", collection_id).upper()
-    for cid in _list_collections_cached(base_url):
-        if re.sub(r"[^A-Za-z0-9]", "", cid).upper() == norm:
-            return cid
-    return collection_id
+    official, by_key = _collection_index(_list_collections_cached(base_url))
+    if collection_id in official:
+        return collection_id
+    return by_key.get(_collection_key(collection_id), collection_id)
+
+
+def _collection_key(collection_id: str) -> str:
+    """Return ``collection_id`` reduced to upper-case alphanumerics."""
+    return _NON_ALNUM_PATTERN.sub("", collection_id).upper()
+
+
+@lru_cache(maxsize=32)
+def _collection_index(
+    collection_ids: tuple[str, ...],
+) -> tuple[frozenset[str], dict[str, str]]:
+    """Return the official IDs and a lookup from normalized to official IDs."""
+    by_key: dict[str, str] = {}
+    for cid in collection_ids:
+        # Keep the first official ID when several normalize to the same key.
+        by_key.setdefault(_collection_key(cid), cid)
+    return frozenset(collection_ids), by_key
 
 
+@lru_cache(maxsize=64)
 def _norm_base(base_url: str) -> str:
     """Return ``base_url`` with exactly one trailing slash."""
     return base_url.rstrip("/") + "/"
 
 
-def _read_json(url: str) -> dict:
+def _canon_url(url: str) -> str:
+    """Return a canonical form of ``url`` used to de-duplicate fetches.
+
+    Scheme and host are lower-cased, trailing slashes and fragments are
+    dropped and query parameters are sorted so that equivalent spellings of
+    the same catalog node map to one key.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, "")
+    )
+
+
+@lru_cache(maxsize=64)
+def _href_template(href: str) -> Template:
+    """Return a cached :class:`string.Template` for an asset ``href``.
+
+    Items of a collection usually share a handful of templated hrefs, so
+    each pattern is only tokenized once.
+    """
+    return Template(href)
+
+
+def _retry_delay(attempt: int, err: urllib.error.HTTPError) -> Union[float, None]:
+    """Return the number of seconds to wait before retrying ``err``.
+
+    ``Retry-After`` may give seconds or an HTTP date.  ``None`` is returned
+    when the server asks for more than ``_MAX_RETRY_AFTER`` seconds.
+    """
+    retry_after = err.headers.get("Retry-After") if err.headers else None
+    if retry_after:
+        retry_after = retry_after.strip()
+        delay: Union[float, None] = None
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            try:
+                when = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                when = None
+            if when is not None:
+                if when.tzinfo is None:
+                    when = when.replace(tzinfo=timezone.utc)
+                delay = max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+        if delay is not None:
+            return delay if delay <= _MAX_RETRY_AFTER else None
+    return random.uniform(0, _BACKOFF_FACTOR * 2**attempt)
+
+
+def _read_json(url: str, *, body: Union[dict, None] = None) -> dict:
+    """Return the JSON document at ``url``.
+
+    When ``body`` is given it is sent as a JSON ``POST`` payload, as required
+    by STAC ``next`` links that declare ``"method": "POST"``.  Rate limits and
+    gateway errors (see ``_RETRY_STATUS``) are retried with exponential
+    backoff; other HTTP errors propagate as :class:`urllib.error.HTTPError`.
+    """
+    # STAC pages are highly compressible; ask for gzip and decode it here since
+    # ``urllib`` does not handle content encodings transparently.
+    headers = {"Accept-Encoding": "gzip"}
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+    req = urllib.request.Request(url, data=data, headers=headers)
+    attempt = 0
+    while True:
+        try:
+            with urllib.request.urlopen(req) as resp:  # type: ignore[call-arg]
+                payload = resp.read()
+                if resp.headers.get("Content-Encoding") == "gzip":
+                    payload = gzip.decompress(payload)
+                return loads(payload)
+        except urllib.error.HTTPError as err:
+            if err.code not in _RETRY_STATUS or attempt >= _MAX_RETRIES:
+                raise
+            delay = _retry_delay(attempt, err)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            attempt += 1
+        except urllib.error.URLError as err:
+            raise SystemExit(f"Could not connect to {url}: {err.reason}") from err
+
+
+@lru_cache(maxsize=32)
+def _supports_fields(base_url: str) -> bool:
+    """Return ``True`` if the API at ``base_url`` declares the Fields extension.
+
+    Only the ``ogcapi-features#fields`` conformance class covers the
+    ``/collections/{id}/items`` endpoint; ``item-search#fields`` applies to
+    ``/search`` alone.  The landing page ``conformsTo`` list is cached per
+    service; the cache is not locked, so callers that fan out over threads
+    should probe once before submitting work.  Servers that cannot be
+    queried are assumed not to support the extension.
+    """
     try:
-        with urllib.request.urlopen(url) as resp:  # type: ignore[call-arg]
-            return json.load(resp)
-    except urllib.error.URLError as err:
-        raise SystemExit(f"Could not connect to {url}: {err.reason}") from err
+        data = _read_json(base_url)
+    # ``_read_json`` reports connection failures as ``SystemExit``; the probe
+    # is optional, so neither should abort the actual item listing.
+    except (urllib.error.URLError, SystemExit):
+        return False
+    return any(
+        str(uri).endswith("/ogcapi-features#fields")
+        for uri in data.get("conformsTo", ())
+    )
 
 
 def list_collections_http(base_url: str, *, deep: bool = False) -> list[str]:
@@ -62,7 +219,8 @@ def list_collections_http(base_url: str, *, deep: bool = False) -> list[str]:
     except urllib.error.HTTPError as err:
         raise SystemExit(f"HTTP error {err.code} for {err.geturl()}") from err
 
-    collections = {c["id"] for c in data.get("collections", [])}
+    collections: set[str] = set()
+    collections.update(c["id"] for c in data.get("collections", ()) if c.get("id"))
 
     if not deep:
         return sorted(collections)
@@ -73,9 +231,10 @@ def list_collections_http(base_url: str, *, deep: bool = False) -> list[str]:
 
     while to_visit:
         cur = to_visit.pop()
-        if cur in visited:
+        key = _canon_url(cur)
+        if key in visited:
             continue
-        visited.add(cur)
+        visited.add(key)
         try:
             data = _read_json(cur)
         except urllib.error.HTTPError as err:
@@ -87,13 +246,12 @@ def list_collections_http(base_url: str, *, deep: bool = False) -> list[str]:
             cid = data.get("id")
             if cid:
                 collections.add(cid)
-        for coll in data.get("collections", []):
-            cid = coll.get("id")
-            if cid:
-                collections.add(cid)
+        collections.update(
+            c["id"] for c in data.get("collections", ()) if c.get("id")
+        )
 
         # Queue any child links for further traversal.
-        for link in data.get("links", []):
+        for link in data.get("links", ()):
             if link.get("rel") == "child":
                 href = link.get("href")
                 if href:
@@ -112,6 +270,44 @@ def _list_collections_cached(base_url: str) -> tuple[str, ...]:
     return tuple(list_collections_http(base_url, deep=True))
 
 
+def _asset_filename(
+    title: Union[str, None], href: Union[str, None], props: dict
+) -> Union[str, None]:
+    """Return a sanitized filename for an asset, or ``None`` if it has none.
+
+    Directory components are stripped and characters outside
+    ``[A-Za-z0-9._-]`` are replaced with ``_``.  ``props`` supplies values for
+    templated (``$var``) hrefs; hrefs with unresolved variables are skipped.
+    """
+    # Many assets use a generic title like "Product" which does not
+    # convey the actual filename.  In such cases prefer extracting
+    # the name from the href.  Only fall back to the title if it is
+    # present and not the generic "Product".
+    if title and title.strip().lower() != "product":
+        filename = title
+    elif href:
+        if "$" in href:
+            href_sub = _href_template(href).safe_substitute(props)
+            if _UNRESOLVED_VAR_PATTERN.search(href_sub):
+                return None
+            href = href_sub
+        m = _ODATA_PRODUCT_PATTERN.search(href)
+        if m:
+            filename = m.group(1)
+        else:
+            parsed_url = urlparse(href)
+            path = Path(parsed_url.path)
+            filename = path.name
+            if not path.suffix:
+                filename += ".dat"
+    else:
+        return None
+    if filename.startswith("$"):
+        return None
+    filename = Path(filename).name
+    return _UNSAFE_FILENAME_PATTERN.sub("_", filename)
+
+
 def iter_asset_filenames(
     collection_id: str,
     *,
@@ -122,7 +318,11 @@ def iter_asset_filenames(
     """Yield asset filenames from items of a collection.
 
     Pagination links (``rel="next"``) are followed until all pages are
-    exhausted or ``limit`` filenames have been yielded.  When ``asset_role`` is
+    exhausted or ``limit`` filenames have been yielded; ``POST`` next links
+    are honoured by re-sending their ``body``.  A file exposed under several
+    asset keys of the same item is yielded once.  Services declaring the STAC
+    API Fields extension are asked to return only item properties and
+    assets.  When ``asset_role`` is
     provided, only assets declaring that role are considered.  Resulting
     filenames are sanitized: directory components are stripped and any
     characters outside ``[A-Za-z0-9._-]`` are replaced with ``_``.
@@ -130,11 +330,15 @@ def iter_asset_filenames(
     base = _norm_base(base_url)
     collection_id = _norm_collection_id(collection_id, base_url=base)
     url = urljoin(base, f"collections/{collection_id}/items?limit={limit}")
+    if _supports_fields(base):
+        # Skip geometries, links and other item members that are never read.
+        url += f"&fields={_ITEM_FIELDS}"
     remaining = limit
     first_request = True
+    body: Union[dict, None] = None
     while url and remaining > 0:
         try:
-            data = _read_json(url)
+            data = _read_json(url, body=body)
         except urllib.error.HTTPError as err:
             if first_request and err.code == 404:
                 raise SystemExit(
@@ -146,48 +350,80 @@ def iter_asset_filenames(
         for feat in data.get("features", []):
             props = feat.get("properties", {})
             assets = feat.get("assets", {})
+            # Titles such as "Thumbnail" repeat on every item, so duplicates
+            # are only dropped within a single feature.
+            seen: set[str] = set()
             for asset in assets.values():
                 if asset_role and asset_role not in (asset.get("roles") or []):
                     continue
-                title = asset.get("title")
-                href = asset.get("href")
-                filename = None
-                # Many assets use a generic title like "Product" which does not
-                # convey the actual filename.  In such cases prefer extracting
-                # the name from the href.  Only fall back to the title if it is
-                # present and not the generic "Product".
-                if title and title.strip().lower() != "product":
-                    filename = title
-                elif href:
-                    if "$" in href:
-                        href_sub = Template(href).safe_substitute(props)
-                        if re.search(r"\$(?!value\b)\w+", href_sub):
-                            continue
-                        href = href_sub
-                    m = re.search(r"Products\('([^']+)'\)", href)
-                    if m:
-                        filename = m.group(1)
-                    else:
-                        parsed_url = urlparse(href)
-                        path = Path(parsed_url.path)
-                        filename = path.name
-                        if not path.suffix:
-                            filename += ".dat"
-                else:
+                filename = _asset_filename(asset.get("title"), asset.get("href"), props)
+                if filename is None:
                     continue
-                if filename.startswith("$"):
+                # Items often expose one file under several asset keys.
+                if filename in seen:
                     continue
-                filename = Path(filename).name
-                filename = re.sub(r"[^A-Za-z0-9._-]", "_", filename)
+                seen.add(filename)
                 yield filename
                 remaining -= 1
                 if remaining == 0:
                     return
-        url = None
-        for link in data.get("links", []):
-            if link.get("rel") == "next":
-                url = link.get("href")
-                break
+        link = next(
+            (lk for lk in data.get("links", ()) if lk.get("rel") == "next"), None
+        )
+        url = link.get("href") if link else None
+        body = None
+        if link and str(link.get("method", "GET")).upper() == "POST":
+            # The initial request is a plain GET, so a ``merge`` flag has no
+            # previous body to combine with and the link body is used as is.
+            body = link.get("body") or {}
+
+
+def iter_leaf_collections(collection_id: str, *, base_url: str) -> Iterable[str]:
+    """Yield the IDs of all leaf collections below ``collection_id``.
+
+    Child links (``rel="child"``) are followed depth-first in document order.
+    Only collection documents are requested; items are not fetched.  The leaf
+    list is cached per ``(collection_id, base_url)`` so repeated samples of
+    the same tree do not walk it again.
+    """
+    yield from _leaf_collections_cached(collection_id, _norm_base(base_url))
+
+
+@lru_cache(maxsize=32)
+def _leaf_collections_cached(collection_id: str, base: str) -> tuple[str, ...]:
+    """Cached helper walking the collection tree below ``collection_id``."""
+    leaves: list[str] = []
+    stack = [collection_id]
+    # Collections linked from several parents are fetched and reported once.
+    visited: set[str] = set()
+    while stack:
+        cid = _norm_collection_id(stack.pop(), base_url=base)
+        if cid in visited:
+            continue
+        visited.add(cid)
+        url = urljoin(base, f"collections/{cid}")
+        try:
+            data = _read_json(url)
+        except urllib.error.HTTPError as err:
+            if err.code == 404:
+                raise SystemExit(
+                    f"Collection '{cid}' not found at {base}. "
+                    "Use `parseo stac-sample <collection> --stac-url <url>` with a valid collection ID."
+                ) from err
+            raise SystemExit(f"HTTP error {err.code} for {err.geturl()}") from err
+
+        children = [
+            link.get("href", "").rstrip("/").rpartition("/")[2]
+            for link in data.get("links", [])
+            if link.get("rel") == "child"
+        ]
+        if children:
+            # Reverse so children are visited in document order.
+            stack.extend(reversed(children))
+        else:
+            leaves.append(cid)
+    return tuple(leaves)
+
 
 def iter_collection_tree(
     collection_id: str,
@@ -204,37 +440,36 @@ def iter_collection_tree(
     parameter is forwarded to :func:`iter_asset_filenames`.
     """
     base = _norm_base(base_url)
-    collection_id = _norm_collection_id(collection_id, base_url=base)
-    url = urljoin(base, f"collections/{collection_id}")
-    try:
-        data = _read_json(url)
-    except urllib.error.HTTPError as err:
-        if err.code == 404:
-            raise SystemExit(
-                f"Collection '{collection_id}' not found at {base}. "
-                "Use `parseo stac-sample <collection> --stac-url <url>` with a valid collection ID."
-            ) from err
-        raise SystemExit(f"HTTP error {err.code} for {err.geturl()}") from err
-
-    children = [
-        link.get("href", "").rstrip("/").split("/")[-1]
-        for link in data.get("links", [])
-        if link.get("rel") == "child"
-    ]
-
-    if children:
-        for child in children:
-            yield from iter_collection_tree(
-                child, base_url=base, limit=limit, asset_role=asset_role
-            )
-    else:
+    for leaf in iter_leaf_collections(collection_id, base_url=base):
         for fn in itertools.islice(
             iter_asset_filenames(
-                collection_id, base_url=base, limit=limit, asset_role=asset_role
+                leaf, base_url=base, limit=limit, asset_role=asset_role
             ),
             limit,
         ):
-            yield collection_id, fn
+            yield leaf, fn
+
+
+def fetch_asset_filenames(
+    collection_id: str,
+    *,
+    base_url: str,
+    limit: int = 100,
+    asset_role: Union[str, None] = None,
+) -> list[str]:
+    """Return up to ``limit`` asset filenames of a collection as a list.
+
+    Convenience wrapper around :func:`iter_asset_filenames` for callers that
+    need the filenames materialized, such as per-leaf sampling.
+    """
+    return list(
+        itertools.islice(
+            iter_asset_filenames(
+                collection_id, base_url=base_url, limit=limit, asset_role=asset_role
+            ),
+            limit,
+        )
+    )
 
 
 def sample_collection_filenames(
@@ -250,13 +485,30 @@ def sample_collection_filenames(
     resolvable via :func:`list_collections_http`.  When ``collection_id`` has
     child collections, a sample is collected from each leaf.  Only assets whose
     ``roles`` include ``asset_role`` are returned when the parameter is
-    supplied.
+    supplied.  Leaves are sampled concurrently since each request is
+    independent and dominated by network latency.
     """
+    base = _norm_base(base_url)
+    leaves = list(iter_leaf_collections(collection_id, base_url=base))
+    if not leaves:
+        return {}
+    # Probe the Fields extension up front; otherwise every worker misses the
+    # cache at once and requests the landing page itself.
+    _supports_fields(base)
     out: dict[str, list[str]] = {}
-    for cid, fn in iter_collection_tree(
-        collection_id, base_url=base_url, limit=samples, asset_role=asset_role
-    ):
-        lst = out.setdefault(cid, [])
-        if len(lst) < samples:
-            lst.append(fn)
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(leaves))) as pool:
+        futures = [
+            pool.submit(
+                fetch_asset_filenames,
+                cid,
+                base_url=base,
+                limit=samples,
+                asset_role=asset_role,
+            )
+            for cid in leaves
+        ]
+        for cid, future in zip(leaves, futures):
+            filenames = future.result()
+            if filenames:
+                out[cid] = filenames
     return out
@@ -7,17 +7,69 @@ only depends on the Python standard library see :mod:`parseo.stac_http`.
 """
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import shutil
+import threading
+from typing import Any
 from typing import Union
 from urllib.parse import urlparse
 
+from .stac_http import _UNSAFE_FILENAME_PATTERN
+from .stac_http import _asset_filename
+
+# Connection pool sizes and ``(connect, read)`` timeout in seconds for asset
+# downloads.
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 32
+_TIMEOUT = (5, 30)
+
+# Block size used when streaming downloaded assets to disk.
+_CHUNK_SIZE = 1 << 20
+
+# Upper bound on child catalogs opened concurrently by
+# :func:`list_collections_client`.
+_MAX_WORKERS = 16
+
+# Default number of concurrent downloads and of search results considered by
+# :func:`search_stac_and_download_many`.
+_MAX_DOWNLOADS = 8
+_MAX_ITEMS = 100
+
+# ``requests.Session`` shared by all downloads so repeated requests to the
+# same host reuse pooled keep-alive connections.  Created lazily because
+# ``requests`` is an optional dependency.
+_SESSION: Any = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session(requests: Any) -> Any:
+    """Return the shared download session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=_POOL_CONNECTIONS,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=3,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
 def list_collections_client(base_url: str, *, deep: bool = False) -> list[str]:
     """Return collection IDs from a STAC API using ``pystac-client``.
 
     Parameters mirror :func:`parseo.stac_http.list_collections_http` but
     this variant requires the optional ``pystac-client`` dependency.  It is
     suitable when more advanced STAC handling is needed, at the cost of pulling
-    in the external library.
+    in the external library.  Child catalogs of a deep listing are opened
+    concurrently, and results are cached per ``(base_url, deep)``.
 
     Raises
     ------
@@ -25,31 +77,49 @@ def list_collections_client(base_url: str, *, deep: bool = False) -> list[str]:
         If ``pystac-client`` is not installed.
     """
     try:
-        from pystac_client import Client
+        from pystac_client import Client  # noqa: F401
     except Exception as exc:  # pragma: no cover - exercised when dependency missing
         raise ImportError(
             "pystac-client is required for list_collections_client"
         ) from exc
 
+    return list(_list_collections_client_cached(base_url, deep))
+
+
+@lru_cache(maxsize=32)
+def _list_collections_client_cached(base_url: str, deep: bool) -> tuple[str, ...]:
+    """Cached helper for :func:`list_collections_client`."""
+    from pystac_client import Client
+
     client = Client.open(base_url)
     collections = {c.id for c in client.get_collections()}
     if not deep:
-        return sorted(collections)
+        return tuple(sorted(collections))
 
-    # Breadth-first traversal of child catalogs.
-    to_visit = list(client.get_children())
-    visited: set[str] = set()
-    while to_visit:
-        child = to_visit.pop()
-        href = getattr(child, "href", None) or getattr(child, "target", None)
-        if not href or href in visited:
-            continue
-        visited.add(href)
+    def expand(href: str) -> tuple[list[str], list[Any]]:
         sub_client = Client.open(href)
-        collections.update(c.id for c in sub_client.get_collections())
-        to_visit.extend(sub_client.get_children())
+        ids = [c.id for c in sub_client.get_collections()]
+        return ids, list(sub_client.get_children())
+
+    # Breadth-first traversal of child catalogs.  Each level is opened
+    # concurrently; bookkeeping stays in this thread so no locking is needed.
+    frontier = list(client.get_children())
+    visited: set[str] = set()
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+        while frontier:
+            hrefs = []
+            for child in frontier:
+                href = getattr(child, "href", None) or getattr(child, "target", None)
+                if not href or href in visited:
+                    continue
+                visited.add(href)
+                hrefs.append(href)
+            frontier = []
+            for ids, children in pool.map(expand, hrefs):
+                collections.update(ids)
+                frontier.extend(children)
 
-    return sorted(collections)
+    return tuple(sorted(collections))
 
 
 def search_stac_and_download(
@@ -63,8 +133,9 @@ def search_stac_and_download(
     """Download the first asset matching a STAC search.
 
     The search is performed via :mod:`pystac-client` and the asset is retrieved
-    with :mod:`requests`. ``dest_dir`` is created if needed and the path to the
-    downloaded file is returned.
+    with :mod:`requests` through a shared, connection-pooling session.
+    ``dest_dir`` is created if needed and the path to the downloaded file is
+    returned.
 
     Raises
     ------
@@ -89,8 +160,122 @@ def search_stac_and_download(
             "requests is required for search_stac_and_download"
         ) from exc
 
+    session = _get_session(requests)
     client = Client.open(stac_url)
     search = client.search(collections=collections, bbox=bbox, datetime=datetime)
+    for href, dest_path in _iter_asset_targets(search, dest_dir):
+        try:
+            _download(session, href, dest_path)
+            return dest_path
+        except requests.HTTPError:
+            continue
+    raise FileNotFoundError("No matching assets found")
+
+
+def search_stac_and_download_many(
+    *,
+    stac_url: str,
+    collections: list[str],
+    bbox: Union[list[float], tuple[float, float, float, float]],
+    datetime: str,
+    dest_dir: Union[str, Path],
+    limit: int = _MAX_ITEMS,
+    max_workers: int = _MAX_DOWNLOADS,
+) -> list[Union[Path, Exception]]:
+    """Download all assets of up to ``limit`` items matching a STAC search.
+
+    Parameters mirror :func:`search_stac_and_download`.  Each asset is saved as
+    ``dest_dir/<item id>/<file name>``, where the file name follows
+    :func:`parseo.stac_http.iter_asset_filenames` and is suffixed when two
+    assets of an item would otherwise share it; assets with the same href are
+    downloaded once.  Up to ``max_workers`` assets are fetched at the same
+    time over the shared session.
+
+    Returns one entry per asset in search order: the downloaded path, or the
+    :class:`requests.RequestException` raised while fetching it.
+
+    Raises
+    ------
+    ImportError
+        If ``pystac-client`` or ``requests`` is not installed.
+    FileNotFoundError
+        If the STAC search yields no downloadable assets or all downloads
+        fail.
+    """
+
+    try:
+        from pystac_client import Client
+    except Exception as exc:  # pragma: no cover - exercised when dependency missing
+        raise ImportError(
+            "pystac-client is required for search_stac_and_download_many"
+        ) from exc
+
+    try:
+        import requests
+    except Exception as exc:  # pragma: no cover - exercised when dependency missing
+        raise ImportError(
+            "requests is required for search_stac_and_download_many"
+        ) from exc
+
+    session = _get_session(requests)
+    client = Client.open(stac_url)
+    search = client.search(
+        collections=collections, bbox=bbox, datetime=datetime, max_items=limit
+    )
+    targets = list(_iter_unique_targets(search, dest_dir))
+    if not targets:
+        raise FileNotFoundError("No matching assets found")
+
+    def fetch(href: str, dest_path: Path) -> Union[Path, Exception]:
+        try:
+            _download(session, href, dest_path)
+        except requests.RequestException as exc:
+            return exc
+        return dest_path
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as pool:
+        results = list(pool.map(fetch, *zip(*targets)))
+    if all(isinstance(res, Exception) for res in results):
+        raise FileNotFoundError("No matching assets found") from results[0]
+    return results
+
+
+def _iter_unique_targets(
+    search: Any, dest_dir: Union[str, Path]
+) -> Iterable[tuple[str, Path]]:
+    """Yield one ``(href, destination)`` pair per distinct asset href.
+
+    Destinations are ``dest_dir/<item id>/<file name>`` and never repeat.
+    """
+    dest_dir_path = Path(dest_dir)
+    seen_hrefs: set[str] = set()
+    used: set[Path] = set()
+    for item in search.items():
+        item_dir = dest_dir_path / _UNSAFE_FILENAME_PATTERN.sub("_", str(item.id))
+        props = getattr(item, "properties", None) or {}
+        for asset in item.assets.values():
+            href = getattr(asset, "href", None)
+            if not href or href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
+            name = _asset_filename(getattr(asset, "title", None), href, props)
+            if name is None:
+                continue
+            dest_path = item_dir / name
+            n = 1
+            while dest_path in used:
+                stem, dot, suffix = name.partition(".")
+                dest_path = item_dir / f"{stem}_{n}{dot}{suffix}"
+                n += 1
+            used.add(dest_path)
+            yield href, dest_path
+
+
+def _iter_asset_targets(
+    search: Any, dest_dir: Union[str, Path]
+) -> Iterable[tuple[str, Path]]:
+    """Yield ``(href, destination)`` pairs for the assets of ``search``."""
+    dest_dir_path = Path(dest_dir)
     for item in search.items():
         for asset in item.assets.values():
             href = getattr(asset, "href", None)
@@ -99,17 +284,16 @@ def search_stac_and_download(
             name = getattr(asset, "title", None)
             if not name:
                 name = Path(urlparse(href).path).name
-            dest_dir_path = Path(dest_dir)
-            dest_dir_path.mkdir(parents=True, exist_ok=True)
-            dest_path = dest_dir_path / name
-            try:
-                with requests.get(href, stream=True) as resp:
-                    resp.raise_for_status()
-                    with open(dest_path, "wb") as fh:
-                        for chunk in resp.iter_content(chunk_size=8192):
-                            if chunk:
-                                fh.write(chunk)
-                return dest_path
-            except requests.HTTPError:
-                continue
-    raise FileNotFoundError("No matching assets found")
+            yield href, dest_dir_path / name
+
+
+def _download(session: Any, href: str, dest_path: Path) -> None:
+    """Stream ``href`` to ``dest_path`` using ``session``."""
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    with session.get(href, stream=True, timeout=_TIMEOUT) as resp:
+        resp.raise_for_status()
+        # Copy straight from the raw stream in large blocks; let urllib3 undo
+        # any transfer compression that ``iter_content`` would have handled.
+        resp.raw.decode_content = True
+        with open(dest_path, "wb") as fh:
+            shutil.copyfileobj(resp.raw, fh, length=_CHUNK_SIZE)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
+import json
 import re
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Tuple
@@ -34,45 +37,82 @@ def _field_regex(spec: Union[Dict, None]) -> str:
         pattern = pattern[:-1]
     return pattern
 
+
 def compile_template(template: str, fields: Dict[str, Dict]) -> Tuple[str, List[str]]:
     """Compile *template* into a regex pattern and extract field order.
 
     ``{field}`` placeholders are replaced using patterns or enums from
     *fields*. Optional segments can be denoted with ``[ ... ]`` and will be
     converted into non-capturing optional groups. The returned pattern is
-    anchored with ``^`` and ``$``.
+    anchored with ``^`` and ``$``. Results are cached per template and field
+    specification.
     """
+    pattern, order = _compile_cached(template, _freeze_fields(fields))
+    return pattern, list(order)
+
+
+def _freeze_fields(fields: Union[Dict[str, Dict], None]) -> str:
+    """Return a hashable cache key for a field specification mapping."""
+    return json.dumps(fields or {}, sort_keys=True)
+
+
+@lru_cache(maxsize=256)
+def _tokenize(template: str) -> Tuple[Tuple[str, Any], ...]:
+    """Split *template* into cached tokens.
+
+    Tokens are ``("literal", text)`` for runs of literal characters,
+    ``("field", name)`` for ``{name}`` placeholders and
+    ``("optional", tokens)`` for ``[ ... ]`` segments.
+    """
+    tokens: List[Tuple[str, Any]] = []
+    literal_start = 0
+    i = 0
+    while i < len(template):
+        ch = template[i]
+        if ch not in "{[":
+            i += 1
+            continue
+        if literal_start < i:
+            tokens.append(("literal", template[literal_start:i]))
+        if ch == "{":
+            j = template.index("}", i)
+            tokens.append(("field", template[i + 1 : j]))
+            i = j + 1
+        else:
+            depth = 1
+            j = i + 1
+            while j < len(template) and depth:
+                if template[j] == "[":
+                    depth += 1
+                elif template[j] == "]":
+                    depth -= 1
+                j += 1
+            tokens.append(("optional", _tokenize(template[i + 1 : j - 1])))
+            i = j
+        literal_start = i
+    if literal_start < len(template):
+        tokens.append(("literal", template[literal_start:]))
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(template: str, frozen_fields: str) -> Tuple[str, Tuple[str, ...]]:
+    fields: Dict[str, Dict] = json.loads(frozen_fields)
     order: List[str] = []
 
-    def _compile(segment: str) -> str:
-        result = ""
-        i = 0
-        while i < len(segment):
-            ch = segment[i]
-            if ch == "{":
-                j = segment.index("}", i)
-                name = segment[i + 1 : j]
-                if name not in order:
-                    order.append(name)
-                regex = _field_regex(fields.get(name))
-                result += f"(?P<{name}>{regex})"
-                i = j + 1
-            elif ch == "[":
-                depth = 1
-                j = i + 1
-                while j < len(segment) and depth:
-                    if segment[j] == "[":
-                        depth += 1
-                    elif segment[j] == "]":
-                        depth -= 1
-                    j += 1
-                inner = segment[i + 1 : j - 1]
-                result += f"(?:{_compile(inner)})?"
-                i = j
+    def _compile(tokens: Tuple[Tuple[str, Any], ...]) -> str:
+        parts: List[str] = []
+        for kind, value in tokens:
+            if kind == "field":
+                if value not in order:
+                    order.append(value)
+                parts.append(f"(?P<{value}>{_field_regex(fields.get(value))})")
+            elif kind == "optional":
+                parts.append(f"(?:{_compile(value)})?")
             else:
-                result += re.escape(ch)
-                i += 1
-        return result
+                # Literal runs are escaped in one call rather than per character.
+                parts.append(re.escape(value))
+        return "".join(parts)
 
-    pattern = "^" + _compile(template) + "$"
-    return pattern, order
+    pattern = "^" + _compile(_tokenize(template)) + "$"
+    return pattern, tuple(order)
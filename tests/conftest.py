@@ -1,17 +1,31 @@
 
-import json
 import pathlib
-import re
 import sys
 
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+ROOT = pathlib.Path(__file__).resolve().parents[1]
 
-def load_schema_by_name(root_dir: str, fname: str):
-    root = pathlib.Path(root_dir)
-    for p in root.rglob(fname):
-        return json.loads(p.read_text(encoding="utf-8")), p
-    raise FileNotFoundError(f"Could not locate schema file '{fname}' under {root_dir}")
+sys.path.insert(0, str(ROOT / "src"))
 
-def match_example(pattern: str, example: str):
-    rx = re.compile(pattern)
-    return bool(rx.match(example))
+import pytest  # noqa: E402
+
+from parseo import assembler  # noqa: E402
+from parseo import schema_registry  # noqa: E402
+
+SCHEMAS_ROOT = ROOT / "src/parseo/schemas"
+
+
+@pytest.fixture(autouse=True, scope="session")
+def warm_schema_cache():
+    """Parse every bundled schema once so tests start from warm caches."""
+    for path in SCHEMAS_ROOT.rglob("*.json"):
+        schema_registry._load_json_from_path(path)
+        assembler._load_schema(path)
+        assembler._load_schema(str(path))
+
+
+@pytest.fixture
+def isolated_schema_registry():
+    """Reset registry caches around tests that swap in their own schema files."""
+    schema_registry.clear_cache()
+    yield
+    schema_registry.clear_cache()
@@ -1,6 +1,9 @@
+import functools
 import io
 import json
 import sys
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version
 
 import pytest
 
@@ -9,12 +12,23 @@ from parseo.parser import describe_schema
 from parseo.parser import parse_auto
 from parseo.schema_registry import list_schema_families
 
+try:
+    _EXPECTED_VERSION = version("parseo")
+except PackageNotFoundError:
+    _EXPECTED_VERSION = "unknown"
 
-def _schema_example_args(family: str) -> tuple[str, list[str]]:
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(name: str):
+    return parse_auto(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_example_args(family: str) -> tuple[str, tuple[str, ...]]:
     info = describe_schema(family)
     example = info["examples"][0]
-    fields = parse_auto(example).fields
-    args = [f"{k}={v}" for k, v in fields.items() if v is not None]
+    fields = _parse_cached(example).fields
+    args = tuple(f"{k}={v}" for k, v in fields.items() if v is not None)
     return example, args
 
 
@@ -26,7 +40,7 @@ def test_cli_parse_writes_output_file(tmp_path, capsys):
     assert captured.out == ""
     data = json.loads(target.read_text(encoding="utf-8"))
     assert data["valid"] is True
-    assert data["fields"] == parse_auto(example).fields
+    assert data["fields"] == _parse_cached(example).fields
 
 
 def test_cli_reports_version(capsys):
@@ -34,25 +48,12 @@ def test_cli_reports_version(capsys):
         cli.main(["--version"])
     assert exc.value.code == 0
     out = capsys.readouterr().out.strip()
-    from importlib.metadata import PackageNotFoundError
-    from importlib.metadata import version
-
-    try:
-        expected = version("parseo")
-    except PackageNotFoundError:
-        expected = "unknown"
-    assert out == f"parseo version {expected}"
-
-
-def test_cli_assemble_success(capsys):
-    example, args = _schema_example_args("WIC")
-    assert cli.main(["assemble", *args]) == 0
-    captured = capsys.readouterr()
-    assert captured.out.strip() == example
+    assert out == f"parseo version {_EXPECTED_VERSION}"
 
 
-def test_cli_assemble_fapar_success(capsys):
-    example, args = _schema_example_args("VEGETATION-INDEX")
+@pytest.mark.parametrize("family", ["WIC", "VEGETATION-INDEX"])
+def test_cli_assemble_success(family, capsys):
+    example, args = _schema_example_args(family)
     assert cli.main(["assemble", *args]) == 0
     captured = capsys.readouterr()
     assert captured.out.strip() == example
@@ -72,23 +73,21 @@ def test_cli_assemble_version_requires_family():
     assert str(exc.value) == "--version requires --family to be set."
 
 def test_fields_json_invalid_string():
-    sys.argv = ["parseo", "assemble", "--fields-json", "{"]
     with pytest.raises(SystemExit) as exc:
-        cli.main()
+        cli.main(["assemble", "--fields-json", "{"])
     assert "--fields-json is not valid JSON" in str(exc.value)
 
 
 def test_fields_json_invalid_stdin(monkeypatch):
-    sys.argv = ["parseo", "assemble", "--fields-json", "-"]
     monkeypatch.setattr(sys, "stdin", io.StringIO("{"))
     with pytest.raises(SystemExit) as exc:
-        cli.main()
+        cli.main(["assemble", "--fields-json", "-"])
     assert "--fields-json '-' is not valid JSON" in str(exc.value)
 
 
 def test_fields_json_accepts_parse_output(capsys):
     example, _ = _schema_example_args("ST")
-    payload = parse_auto(example)
+    payload = _parse_cached(example)
     fields_json = json.dumps(
         {
             "fields": payload.fields,
@@ -115,7 +114,7 @@ def test_fields_json_accepts_parse_output(capsys):
 
 def test_stdin_accepts_parse_output(monkeypatch, capsys):
     example, _ = _schema_example_args("ST")
-    payload = parse_auto(example)
+    payload = _parse_cached(example)
     parsed = json.dumps(
         {
             "valid": payload.valid,
@@ -125,14 +124,8 @@ def test_stdin_accepts_parse_output(monkeypatch, capsys):
             "match_family": payload.match_family,
         }
     )
-    sys.argv = [
-        "parseo",
-        "assemble",
-        "--family",
-        "copernicus:clms:hr-vpp:st",
-    ]
     monkeypatch.setattr(sys, "stdin", io.StringIO(parsed))
-    assert cli.main() == 0
+    assert cli.main(["assemble", "--family", "copernicus:clms:hr-vpp:st"]) == 0
     assembled = capsys.readouterr().out.strip()
     assert assembled == example
 
@@ -243,8 +236,7 @@ def test_cli_stac_sample_custom_url(monkeypatch, capsys):
         return {"C1": ["a"], "C2": ["b"]}
 
     monkeypatch.setattr(cli, "sample_collection_filenames", fake_sample)
-    sys.argv = [
-        "parseo",
+    argv = [
         "stac-sample",
         "COL",
         "--samples",
@@ -254,7 +246,7 @@ def test_cli_stac_sample_custom_url(monkeypatch, capsys):
         "--asset-role",
         "data",
     ]
-    assert cli.main() == 0
+    assert cli.main(argv) == 0
     out = capsys.readouterr().out.splitlines()
     assert out == ["C1:", "  a", "C2:", "  b"]
     assert calls == {
@@ -280,13 +272,7 @@ def test_cli_list_stac_collections(monkeypatch, capsys):
         return ["A", "B"]
 
     monkeypatch.setattr(cli, "list_collections_http", fake_list_collections_http)
-    sys.argv = [
-        "parseo",
-        "list-stac-collections",
-        "--stac-url",
-        "http://example",
-    ]
-    assert cli.main() == 0
+    assert cli.main(["list-stac-collections", "--stac-url", "http://example"]) == 0
     out = capsys.readouterr().out.splitlines()
     assert out == ["A", "B"]
     assert called == {"base_url": "http://example", "deep": False}
@@ -301,14 +287,8 @@ def test_cli_list_stac_collections_deep(monkeypatch, capsys):
         return ["X"]
 
     monkeypatch.setattr(cli, "list_collections_http", fake_list_collections_http)
-    sys.argv = [
-        "parseo",
-        "list-stac-collections",
-        "--stac-url",
-        "http://example",
-        "--deep",
-    ]
-    assert cli.main() == 0
+    argv = ["list-stac-collections", "--stac-url", "http://example", "--deep"]
+    assert cli.main(argv) == 0
     out = capsys.readouterr().out.splitlines()
     assert out == ["X"]
     assert called == {"base_url": "http://example", "deep": True}
@@ -320,17 +300,7 @@ def test_kv_pairs_to_dict_duplicate_key():
     assert "Duplicate field 'a'" in str(exc.value)
 
 
-def test_cli_assemble_duplicate_key(monkeypatch):
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        [
-            "parseo",
-            "assemble",
-            "prefix=CLMS_WSI",
-            "prefix=OTHER",
-        ],
-    )
+def test_cli_assemble_duplicate_key():
     with pytest.raises(SystemExit) as exc:
-        cli.main()
+        cli.main(["assemble", "prefix=CLMS_WSI", "prefix=OTHER"])
     assert "Duplicate field 'prefix'" in str(exc.value)
@@ -0,0 +1,25 @@
+import pytest
+
+from parseo._epsg_lookup import mgrs_tile_to_epsg
+
+
+@pytest.mark.parametrize(
+    "tile, expected",
+    [
+        ("T32TNS", "32632"),
+        ("t01cdu", "32701"),
+        ("T60XWA", "32660"),
+        ("T1 CDU", "32701"),
+        ("T+1CDU", "32701"),
+        ("T 1NAA", "32601"),
+        ("T00CDU", None),
+        ("T61CDU", None),
+        ("T-1CDU", None),
+        ("T32ANS", None),
+        ("32TNS", None),
+        ("T1  ", None),
+        (None, None),
+    ],
+)
+def test_mgrs_tile_to_epsg(tile, expected):
+    assert mgrs_tile_to_epsg(tile) == expected
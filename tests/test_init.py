@@ -1,21 +1,23 @@
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version
+
+try:
+    _EXPECTED_VERSION = version("parseo")
+except PackageNotFoundError:
+    _EXPECTED_VERSION = "unknown"
+
+
 def test_star_import_exposes_parser():
     import parseo
+    import parseo.parser as parser_module
 
-    ns = {}
-    exec("from parseo import *", ns)
-
-    assert ns["parser"] is parseo.parser
+    # ``from parseo import *`` binds exactly the names listed in __all__.
+    assert "parser" in parseo.__all__
+    assert parseo.parser is parser_module
 
 
 def test_info_reports_version():
     """The info function should return the installed package version."""
     import parseo
-    from importlib.metadata import PackageNotFoundError
-    from importlib.metadata import version
-
-    try:
-        expected = version("parseo")
-    except PackageNotFoundError:
-        expected = "unknown"
 
-    assert parseo.info()["version"] == expected
+    assert parseo.info()["version"] == _EXPECTED_VERSION
@@ -4,11 +4,15 @@ import parseo.schema_registry as schema_registry
 import pytest
 from functools import lru_cache
 
+S2_NAME = "S2B_MSIL2A_20241123T224759_N0511_R101_T03VUL_20241123T230829.SAFE"
+S1_NAME = (
+    "S1A_IW_SLC__1SDV_20250105T053021_20250105T053048_A054321_D068F2E_ABC123.SAFE"
+)
 
-def test_schema_paths_cached(monkeypatch):
+
+def test_schema_paths_cached(monkeypatch, isolated_schema_registry):
     calls = {"n": 0}
 
-    schema_registry.clear_cache()
     original_discover = parser._discover_family_info
     original_discover.cache_clear()
 
@@ -21,8 +25,8 @@ def test_schema_paths_cached(monkeypatch):
     parser._discover_family_info.cache_clear()
 
     # Two parses should trigger only a single discovery of schema files
-    parser.parse_auto("S2B_MSIL2A_20241123T224759_N0511_R101_T03VUL_20241123T230829.SAFE")
-    parser.parse_auto("S1A_IW_SLC__1SDV_20250105T053021_20250105T053048_A054321_D068F2E_ABC123.SAFE")
+    parser.parse_auto(S2_NAME)
+    parser.parse_auto(S1_NAME)
 
     assert calls["n"] == 1
 
@@ -76,7 +80,7 @@ def test_parse_with_explicit_schema_error(tmp_path):
     assert exc.value.match_family == "DEMO"
 
 
-def test_parse_bom_schema(tmp_path, monkeypatch):
+def test_parse_bom_schema(tmp_path, monkeypatch, isolated_schema_registry):
     import json
 
     schema = {
@@ -90,14 +94,15 @@ def test_parse_bom_schema(tmp_path, monkeypatch):
         yield bom_path
 
     monkeypatch.setattr(schema_registry, "_iter_schema_paths", fake_iter)
-    schema_registry.clear_cache()
 
     res = parse_auto("ABC.SAFE")
     assert res.valid
     assert res.fields["id"] == "ABC"
 
 
-def test_malformed_schema_surfaces_error(tmp_path, monkeypatch):
+def test_malformed_schema_surfaces_error(
+    tmp_path, monkeypatch, isolated_schema_registry
+):
     bad_path = tmp_path / "bad.json"
     bad_path.write_text("not-json", encoding="utf-8")
 
@@ -105,14 +110,15 @@ def test_malformed_schema_surfaces_error(tmp_path, monkeypatch):
         yield bad_path
 
     monkeypatch.setattr(schema_registry, "_iter_schema_paths", fake_iter)
-    schema_registry.clear_cache()
 
     with pytest.raises(RuntimeError) as exc:
         parse_auto("whatever.SAFE")
     assert "Expecting value" in str(exc.value)
 
 
-def test_current_schema_default_and_explicit_version(tmp_path, monkeypatch):
+def test_current_schema_default_and_explicit_version(
+    tmp_path, monkeypatch, isolated_schema_registry
+):
     import json
 
     schema_v1 = {
@@ -138,7 +144,6 @@ def test_current_schema_default_and_explicit_version(tmp_path, monkeypatch):
         yield from [p1, p2]
 
     monkeypatch.setattr(schema_registry, "_iter_schema_paths", fake_iter)
-    schema_registry.clear_cache()
 
     res = parse_auto("ABC_X_v2.txt")
     assert res.valid
@@ -150,10 +155,10 @@ def test_current_schema_default_and_explicit_version(tmp_path, monkeypatch):
     assert res_old.version == "1.0.0"
     assert res_old.fields["id"] == "X"
 
-    schema_registry.clear_cache()
-
 
-def test_validate_schema_accepts_single_path(tmp_path, monkeypatch, capsys):
+def test_validate_schema_accepts_single_path(
+    tmp_path, monkeypatch, capsys, isolated_schema_registry
+):
     import json
 
     schema = {
@@ -168,7 +173,6 @@ def test_validate_schema_accepts_single_path(tmp_path, monkeypatch, capsys):
         yield schema_path
 
     monkeypatch.setattr(schema_registry, "_iter_schema_paths", fake_iter)
-    schema_registry.clear_cache()
 
     # Silent mode should produce no output
     parser.validate_schema(paths=str(schema_path))
@@ -183,7 +187,9 @@ def test_validate_schema_accepts_single_path(tmp_path, monkeypatch, capsys):
     assert "Validated 1 examples" in captured.out
 
 
-def test_parsing_fails_without_current(tmp_path, monkeypatch):
+def test_parsing_fails_without_current(
+    tmp_path, monkeypatch, isolated_schema_registry
+):
     import json
 
     schema = {
@@ -200,208 +206,240 @@ def test_parsing_fails_without_current(tmp_path, monkeypatch):
         yield p
 
     monkeypatch.setattr(schema_registry, "_iter_schema_paths", fake_iter)
-    schema_registry.clear_cache()
 
     with pytest.raises(RuntimeError) as exc:
         parse_auto("ABC_X.txt")
     assert "current" in str(exc.value)
-    schema_registry.clear_cache()
-
-
-def test_parse_urban_atlas_lcu():
-    name = "CLMS_UA_LCU_S2021_V025ha_DK004L3_AALBORG_03035_V01_R00_20240212"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "UA-LCU"
-    assert result.fields == {
-        "programme": "CLMS",
-        "product": "UA",
-        "variable": "LCU",
-        "survey": "S2021",
-        "type": "vector",
-        "resolution": "025ha",
-        "area_code": "DK004L3",
-        "city": "AALBORG",
-        "epsg_code": "03035",
-        "version": "V01",
-        "revision": "R00",
-        "production_date": "20240212",
-    }
-    assert "type_code" not in result.fields
-
-
-def test_parse_clms_clcplus_type_mapping():
-    name = "CLMS_CLCPLUS_RAS_S2023_R10m_E48N37_03035_V01_R00.tif"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "CLCPLUS"
-    assert result.fields["type"] == "raster"
-    assert result.fields["epsg_code"] == "03035"
-    assert "type_code" not in result.fields
-
-
-
-def test_parse_clms_hrl_nvlcc():
-    name = "CLMS_HRLNVLCC_IMD_S2021_R10m_E09N27_03035_V01_R01.tif"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "NVLCC"
-    assert result.fields == {
-        "prefix": "CLMS",
-        "theme": "HRLNVLCC",
-        "variable": "IMD",
-        "temporal_coverage": "S2021",
-        "resolution": "R10m",
-        "tile_id": "E09N27",
-        "epsg_code": "03035",
-        "version": "V01",
-        "release": "R01",
-        "extension": "tif",
-    }
-
-
-def test_parse_clms_hrl_nvlcc_unpadded_epsg():
-    name = "CLMS_HRLNVLCC_IMD_S2021_R10m_E09N27_3035_V01_R01.tif"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "NVLCC"
-    assert result.fields["epsg_code"] == "03035"
-
-
-def test_parse_clms_hrl_small_woody_features():
-    name = "SWF_2018_005m_E34N27_03035.tif"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "SMALL-WOODY-FEATURES"
-    assert result.fields == {
-        "variable": "SWF",
-        "reference_year": "2018",
-        "resolution": "005m",
-        "tile_id": "E34N27",
-        "epsg_code": "03035",
-        "extension": "tif",
-    }
-
-
-def test_parse_clms_hrl_imperviousness():
-    name = "IMD_2021_E042N018_010m_V100.tif"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "IMPERVIOUSNESS"
-    assert result.fields == {
-        "variable": "IMD",
-        "reference_year": "2021",
-        "tile_id": "E042N018",
-        "epsg_code": "03035",
-        "resolution": "010m",
-        "version": "V100",
-        "extension": "tif",
-    }
-
-def test_parse_clms_egms_l3_velocity_grid():
-    name = "EGMS_L3_E28N49_100km_U_2018_2022_1.tiff"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "EGMS-L3"
-    assert result.fields["product"] == "EGMS"
-    assert result.fields["level"] == "L3"
-    assert result.fields["tile"] == "E28N49"
-    assert result.fields["tile_size"] == "100km"
-    assert result.fields["component"] == "U"
-    assert result.fields["start_year"] == "2018"
-    assert result.fields["end_year"] == "2022"
-    assert result.fields["version"] == "1"
-    assert result.fields["extension"] == "tiff"
-
-
-def test_parse_clms_egms_l2a_product_csv():
-    name = "EGMS_L2a_088_0282_IW2_VV_2018_2022_1.csv"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "EGMS-L2A"
-    assert result.fields["product"] == "EGMS"
-    assert result.fields["level"] == "L2a"
-    assert result.fields["track"] == "088"
-    assert result.fields["burst"] == "0282"
-    assert result.fields["swath"] == "IW2"
-    assert result.fields["polarisation"] == "VV"
-    assert result.fields["start_year"] == "2018"
-    assert result.fields["end_year"] == "2022"
-    assert result.fields["version"] == "1"
-    assert result.fields["extension"] == "csv"
-
-
-def test_parse_clms_egms_l2a_product_zip():
-    name = "EGMS_L2a_124_0135_IW1_VH_2015_2020_2.zip"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "EGMS-L2A"
-    assert result.fields["product"] == "EGMS"
-    assert result.fields["level"] == "L2a"
-    assert result.fields["track"] == "124"
-    assert result.fields["burst"] == "0135"
-    assert result.fields["swath"] == "IW1"
-    assert result.fields["polarisation"] == "VH"
-    assert result.fields["start_year"] == "2015"
-    assert result.fields["end_year"] == "2020"
-    assert result.fields["version"] == "2"
-    assert result.fields["extension"] == "zip"
-
-
-def test_parse_clms_egms_gnss_model():
-    name = "EGMS_AEPND_V2023.1.csv"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "EGMS-GNSS-MODEL"
-    assert result.fields["product"] == "EGMS"
-    assert result.fields["variable"] == "AEPND"
-    assert result.fields["issue_year"] == "V2023"
-    assert result.fields["revision"] == "1"
-    assert result.fields["extension"] == "csv"
-
-
-def test_parse_modis_stac_mapping():
-    name = "MOD09GA.A2021123.h18v04.006.2021132234506.hdf"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "MODIS"
-    assert result.fields["platform"] == "Terra"
-    assert result.fields["instrument"] == "MODIS"
-    assert result.fields["platform_code"] == "MOD"
-    assert result.fields["product"] == "09"
 
 
-def test_parse_landsat_stac_mapping():
-    name = "LC08_L1TP_190026_20200101_20200114_02_T1.tar"
+# Examples whose parsed fields are checked in full.
+EXACT_EXAMPLES = [
+    pytest.param(
+        "CLMS_UA_LCU_S2021_V025ha_DK004L3_AALBORG_03035_V01_R00_20240212",
+        "UA-LCU",
+        {
+            "programme": "CLMS",
+            "product": "UA",
+            "variable": "LCU",
+            "survey": "S2021",
+            "type": "vector",
+            "resolution": "025ha",
+            "area_code": "DK004L3",
+            "city": "AALBORG",
+            "epsg_code": "03035",
+            "version": "V01",
+            "revision": "R00",
+            "production_date": "20240212",
+        },
+        id="urban-atlas-lcu",
+    ),
+    pytest.param(
+        "CLMS_HRLNVLCC_IMD_S2021_R10m_E09N27_03035_V01_R01.tif",
+        "NVLCC",
+        {
+            "prefix": "CLMS",
+            "theme": "HRLNVLCC",
+            "variable": "IMD",
+            "temporal_coverage": "S2021",
+            "resolution": "R10m",
+            "tile_id": "E09N27",
+            "epsg_code": "03035",
+            "version": "V01",
+            "release": "R01",
+            "extension": "tif",
+        },
+        id="hrl-nvlcc",
+    ),
+    pytest.param(
+        "SWF_2018_005m_E34N27_03035.tif",
+        "SMALL-WOODY-FEATURES",
+        {
+            "variable": "SWF",
+            "reference_year": "2018",
+            "resolution": "005m",
+            "tile_id": "E34N27",
+            "epsg_code": "03035",
+            "extension": "tif",
+        },
+        id="hrl-small-woody-features",
+    ),
+    pytest.param(
+        "IMD_2021_E042N018_010m_V100.tif",
+        "IMPERVIOUSNESS",
+        {
+            "variable": "IMD",
+            "reference_year": "2021",
+            "tile_id": "E042N018",
+            "epsg_code": "03035",
+            "resolution": "010m",
+            "version": "V100",
+            "extension": "tif",
+        },
+        id="hrl-imperviousness",
+    ),
+    pytest.param(
+        "N2K_Change_2012-2018_EPSG3035_V2_0.zip",
+        "N2K",
+        {
+            "theme": "N2K_Change",
+            "reference": "2012-2018",
+            "epsg_code": "03035",
+            "version": "V2_0",
+            "extension": "zip",
+        },
+        id="n2k-change",
+    ),
+]
+
+# Examples where only a subset of fields is checked; the last element lists
+# fields that must not appear in the result.
+PARTIAL_EXAMPLES = [
+    pytest.param(
+        "CLMS_CLCPLUS_RAS_S2023_R10m_E48N37_03035_V01_R00.tif",
+        "CLCPLUS",
+        {"type": "raster", "epsg_code": "03035"},
+        ("type_code",),
+        id="clcplus-type-mapping",
+    ),
+    pytest.param(
+        "CLMS_HRLNVLCC_IMD_S2021_R10m_E09N27_3035_V01_R01.tif",
+        "NVLCC",
+        {"epsg_code": "03035"},
+        (),
+        id="hrl-nvlcc-unpadded-epsg",
+    ),
+    pytest.param(
+        "EGMS_L3_E28N49_100km_U_2018_2022_1.tiff",
+        "EGMS-L3",
+        {
+            "product": "EGMS",
+            "level": "L3",
+            "tile": "E28N49",
+            "tile_size": "100km",
+            "component": "U",
+            "start_year": "2018",
+            "end_year": "2022",
+            "version": "1",
+            "extension": "tiff",
+        },
+        (),
+        id="egms-l3-velocity-grid",
+    ),
+    pytest.param(
+        "EGMS_L2a_088_0282_IW2_VV_2018_2022_1.csv",
+        "EGMS-L2A",
+        {
+            "product": "EGMS",
+            "level": "L2a",
+            "track": "088",
+            "burst": "0282",
+            "swath": "IW2",
+            "polarisation": "VV",
+            "start_year": "2018",
+            "end_year": "2022",
+            "version": "1",
+            "extension": "csv",
+        },
+        (),
+        id="egms-l2a-csv",
+    ),
+    pytest.param(
+        "EGMS_L2a_124_0135_IW1_VH_2015_2020_2.zip",
+        "EGMS-L2A",
+        {
+            "product": "EGMS",
+            "level": "L2a",
+            "track": "124",
+            "burst": "0135",
+            "swath": "IW1",
+            "polarisation": "VH",
+            "start_year": "2015",
+            "end_year": "2020",
+            "version": "2",
+            "extension": "zip",
+        },
+        (),
+        id="egms-l2a-zip",
+    ),
+    pytest.param(
+        "EGMS_AEPND_V2023.1.csv",
+        "EGMS-GNSS-MODEL",
+        {
+            "product": "EGMS",
+            "variable": "AEPND",
+            "issue_year": "V2023",
+            "revision": "1",
+            "extension": "csv",
+        },
+        (),
+        id="egms-gnss-model",
+    ),
+    pytest.param(
+        "MOD09GA.A2021123.h18v04.006.2021132234506.hdf",
+        "MODIS",
+        {
+            "platform": "Terra",
+            "instrument": "MODIS",
+            "platform_code": "MOD",
+            "product": "09",
+        },
+        (),
+        id="modis-stac-mapping",
+    ),
+    pytest.param(
+        "LC08_L1TP_190026_20200101_20200114_02_T1.tar",
+        "LANDSAT",
+        {
+            "platform": "landsat-8",
+            "instrument": "OLI_TIRS",
+            "platform_code": "LC08",
+            "epsg_code": "32619",
+        },
+        (),
+        id="landsat-stac-mapping",
+    ),
+    pytest.param(
+        S2_NAME,
+        "S2",
+        {"tile_id": "T03VUL", "epsg_code": "32603"},
+        (),
+        id="sentinel2-epsg-lookup",
+    ),
+    pytest.param(
+        "VPP_2017_S2_T32TPR-010m_V101_s1_AMPL.tif",
+        "VPP",
+        {"tile": "T32TPR", "tile_id": "T32TPR"},
+        ("mgrs_tile",),
+        id="hr-vpp-mgrs-tile",
+    ),
+    pytest.param(
+        "VPP_2017_S2_E45N28-03035-010m_V101_s1_EOSD.tif",
+        "VPP",
+        {"tile": "E45N28", "tile_id": "E45N28", "epsg_code": "03035"},
+        ("mgrs_tile",),
+        id="hr-vpp-eea-tile",
+    ),
+]
+
+
+@pytest.mark.parametrize("name, family, expected", EXACT_EXAMPLES)
+def test_parse_example_fields(name, family, expected):
     result = parse_auto(name)
 
     assert result.valid
-    assert result.match_family == "LANDSAT"
-    assert result.fields["platform"] == "landsat-8"
-    assert result.fields["instrument"] == "OLI_TIRS"
-    assert result.fields["platform_code"] == "LC08"
-    assert result.fields["epsg_code"] == "32619"
+    assert result.match_family == family
+    assert result.fields == expected
 
 
-def test_parse_sentinel2_epsg_lookup():
-    name = "S2B_MSIL2A_20241123T224759_N0511_R101_T03VUL_20241123T230829.SAFE"
+@pytest.mark.parametrize("name, family, expected, absent", PARTIAL_EXAMPLES)
+def test_parse_example_partial_fields(name, family, expected, absent):
     result = parse_auto(name)
 
     assert result.valid
-    assert result.match_family == "S2"
-    assert result.fields["tile_id"] == "T03VUL"
-    assert result.fields["epsg_code"] == "32603"
+    assert result.match_family == family
+    assert {k: result.fields.get(k) for k in expected} == expected
+    for key in absent:
+        assert key not in result.fields
 
 
 def test_parse_sentinel2_dash_reports_correct_field():
@@ -430,39 +468,65 @@ def test_parse_clms_hr_vpp_invalid_variable_reports_variable_field():
     assert "platform" not in message
 
 
-def test_parse_clms_hr_vpp_tile_id_mgrs():
-    name = "VPP_2017_S2_T32TPR-010m_V101_s1_AMPL.tif"
-    result = parse_auto(name)
-
-    assert result.valid
-    assert result.match_family == "VPP"
-    assert result.fields["tile"] == "T32TPR"
-    assert result.fields["tile_id"] == "T32TPR"
-    assert "mgrs_tile" not in result.fields
+def test_parse_auto_results_are_cached_per_name(monkeypatch):
+    name = S2_NAME
+    schema_registry.clear_cache()
+    first = parse_auto(name)
 
+    def fail(*args, **kwargs):
+        raise AssertionError("parse_auto should have been served from the cache")
 
-def test_parse_clms_hr_vpp_tile_id():
-    name = "VPP_2017_S2_E45N28-03035-010m_V101_s1_EOSD.tif"
-    result = parse_auto(name)
+    monkeypatch.setattr(parser, "_attempt_parse", fail)
+    first.fields["tile_id"] = "mutated"
+    second = parse_auto(name)
+    assert second.fields["tile_id"] == "T03VUL"
 
-    assert result.valid
-    assert result.match_family == "VPP"
-    assert result.fields["tile"] == "E45N28"
-    assert result.fields["tile_id"] == "E45N28"
-    assert result.fields["epsg_code"] == "03035"
-    assert "mgrs_tile" not in result.fields
+    schema_registry.clear_cache()
+    with pytest.raises(AssertionError):
+        parse_auto(name)
 
 
-def test_parse_clms_n2k_change():
-    name = "N2K_Change_2012-2018_EPSG3035_V2_0.zip"
-    result = parse_auto(name)
+def test_combined_dispatch_prefers_first_matching_schema(
+    tmp_path, monkeypatch, isolated_schema_registry
+):
+    import json
 
-    assert result.valid
-    assert result.match_family == "N2K"
-    assert result.fields == {
-        "theme": "N2K_Change",
-        "reference": "2012-2018",
-        "epsg_code": "03035",
-        "version": "V2_0",
-        "extension": "zip",
+    generic = {
+        "schema_id": "x:y:generic",
+        "schema_version": "1.0.0",
+        "status": "current",
+        "template": "{prefix}_{id}.txt",
+        "fields": {"prefix": {"pattern": "[A-Z]+"}, "id": {"pattern": "[A-Z]+"}},
     }
+    other = {
+        "schema_id": "x:y:other",
+        "schema_version": "1.0.0",
+        "status": "current",
+        "template": "{code}_{num}.txt",
+        "fields": {"code": {"pattern": "[A-Z]+"}, "num": {"pattern": "[A-Z]+"}},
+    }
+    p1 = tmp_path / "generic_filename_v1_0_0.json"
+    p2 = tmp_path / "other_filename_v1_0_0.json"
+    p1.write_text(json.dumps(generic))
+    p2.write_text(json.dumps(other))
+
+    def fake_iter(pkg: str):
+        yield from [p1, p2]
+
+    monkeypatch.setattr(schema_registry, "_iter_schema_paths", fake_iter)
+
+    combined = parser._combined_pattern((p1, p2))
+    assert combined is not None
+    assert combined[1] == (p1, p2)
+
+    res = parse_auto("XYZ_Q.txt")
+    assert res.fields == {"prefix": "XYZ", "id": "Q"}
+
+
+def test_parse_auto_many_preserves_order_and_copies_fields():
+    names = [S2_NAME, S1_NAME, S2_NAME]
+    results = parser.parse_auto_many(names)
+
+    assert [r.match_family for r in results] == ["S2", "S1", "S2"]
+    assert results[0] == parse_auto(S2_NAME)
+    assert results[0].fields is not results[2].fields
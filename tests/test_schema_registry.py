@@ -1,4 +1,5 @@
 import json
+import os
 
 import parseo.schema_registry as schema_registry
 
@@ -39,3 +40,22 @@ def test_new_schema_discovery(tmp_path, monkeypatch):
     path2 = schema_registry.get_schema_path("abc", pkg=pkg_name)
     assert path2.name == "abc_filename_v2_0_0.json"
 
+
+
+def test_clear_cache_reuses_unchanged_decoded_schemas(tmp_path):
+    path = tmp_path / "abc_filename_v1_0_0.json"
+    path.write_text(json.dumps({"template": "ABC_{id}.txt"}))
+    old = 1_000_000_000
+    os.utime(path, ns=(old, old))
+
+    first = schema_registry._load_json_from_path(path)
+    schema_registry.clear_cache()
+    assert schema_registry._load_json_from_path(path) is first
+
+    path.write_text(json.dumps({"template": "ABCD_{id}.txt"}))
+    os.utime(path, ns=(old + 1, old + 1))
+    schema_registry.clear_cache()
+    assert schema_registry._load_json_from_path(path)["template"] == "ABCD_{id}.txt"
+
+    schema_registry.clear_all()
+    assert str(path) not in schema_registry._DECODED_JSON
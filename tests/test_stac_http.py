@@ -1,8 +1,22 @@
+import gzip
+import io
+import json
+import time
+
 import pytest
 import urllib.error
 import parseo.stac_http as sd
 
 
+@pytest.fixture(autouse=True)
+def _clear_stac_caches():
+    sd._supports_fields.cache_clear()
+    sd._leaf_collections_cached.cache_clear()
+    yield
+    sd._supports_fields.cache_clear()
+    sd._leaf_collections_cached.cache_clear()
+
+
 @pytest.mark.parametrize(
     "alias, expected",
     [
@@ -20,6 +34,17 @@ def test_norm_collection_id_aliases(monkeypatch, alias, expected):
     assert sd._norm_collection_id(alias, base_url="http://x") == expected
 
 
+def test_norm_collection_id_prefers_exact_match(monkeypatch):
+    monkeypatch.setattr(
+        sd,
+        "_list_collections_cached",
+        lambda base_url: ("S2-L2A", "s2_l2a", "other"),
+    )
+    assert sd._norm_collection_id("s2_l2a", base_url="http://x") == "s2_l2a"
+    assert sd._norm_collection_id("S2L2A", base_url="http://x") == "S2-L2A"
+    assert sd._norm_collection_id("unknown", base_url="http://x") == "unknown"
+
+
 def test_list_collections_custom_base_url(monkeypatch):
     urls = []
 
@@ -33,6 +58,12 @@ def test_list_collections_custom_base_url(monkeypatch):
     assert out == ["abc"]
 
 
+def test_list_collections_skips_missing_ids(monkeypatch):
+    collections = [{"id": "b"}, {"id": None}, {"id": ""}, {}, {"id": "a"}]
+    monkeypatch.setattr(sd, "_read_json", lambda url: {"collections": collections})
+    assert sd.list_collections_http(base_url="http://x") == ["a", "b"]
+
+
 def test_list_collections_deep(monkeypatch):
     calls = []
 
@@ -60,10 +91,40 @@ def test_list_collections_deep(monkeypatch):
     assert set(calls) == set(responses)
 
 
+def test_list_collections_deep_skips_equivalent_urls(monkeypatch):
+    calls = []
+
+    responses = {
+        "http://x/collections": {"collections": []},
+        "http://x/": {
+            "links": [
+                {"rel": "child", "href": "cat?b=2&a=1"},
+                {"rel": "child", "href": "cat/?a=1&b=2#top"},
+                {"rel": "child", "href": "HTTP://X/cat?a=1&b=2"},
+            ]
+        },
+        "http://x/cat?b=2&a=1": {"type": "Collection", "id": "C"},
+    }
+
+    def fake_read_json(url):
+        calls.append(url)
+        return responses.get(url, {"type": "Collection", "id": "C"})
+
+    monkeypatch.setattr(sd, "_read_json", fake_read_json)
+
+    assert sd.list_collections_http(base_url="http://x", deep=True) == ["C"]
+    assert len(calls) == 3
+
+
+def test_canon_url_normalizes_equivalent_forms():
+    assert sd._canon_url("HTTP://Host/a/b/?y=2&x=1#frag") == "http://host/a/b?x=1&y=2"
+    assert sd._canon_url("http://host/a/b") == "http://host/a/b"
+
+
 def test_iter_asset_filenames_custom_base_url(monkeypatch):
     urls = []
 
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         urls.append(url)
         if url == "http://y/collections/C1/items?limit=2":
             return {
@@ -88,6 +149,7 @@ def test_iter_asset_filenames_custom_base_url(monkeypatch):
 
     monkeypatch.setattr(sd, "_read_json", fake_read_json)
     monkeypatch.setattr(sd, "_list_collections_cached", lambda base_url: ("C1",))
+    monkeypatch.setattr(sd, "_supports_fields", lambda base_url: False)
     out = list(sd.iter_asset_filenames("C1", base_url="http://y", limit=2))
     assert urls == [
         "http://y/collections/C1/items?limit=2",
@@ -96,8 +158,129 @@ def test_iter_asset_filenames_custom_base_url(monkeypatch):
     assert out == ["file1.tif", "file2.tif"]
 
 
+def test_iter_asset_filenames_requests_fields_when_supported(monkeypatch):
+    urls = []
+
+    def fake_read_json(url, *, body=None):
+        urls.append(url)
+        if url == "http://y/":
+            return {
+                "conformsTo": [
+                    "https://api.stacspec.org/v1.0.0/core",
+                    "https://api.stacspec.org/v1.0.0/ogcapi-features#fields",
+                ]
+            }
+        return {"features": [{"assets": {"a": {"href": "http://files/a.tif"}}}]}
+
+    monkeypatch.setattr(sd, "_read_json", fake_read_json)
+    monkeypatch.setattr(sd, "_list_collections_cached", lambda base_url: ("C1",))
+    assert list(sd.iter_asset_filenames("C1", base_url="http://y", limit=1)) == [
+        "a.tif"
+    ]
+    assert list(sd.iter_asset_filenames("C1", base_url="http://y", limit=1)) == [
+        "a.tif"
+    ]
+    # The landing page is only consulted once per service.
+    assert urls == [
+        "http://y/",
+        "http://y/collections/C1/items?limit=1&fields=properties,assets",
+        "http://y/collections/C1/items?limit=1&fields=properties,assets",
+    ]
+
+
+def test_iter_asset_filenames_ignores_item_search_fields(monkeypatch):
+    urls = []
+
+    def fake_read_json(url, *, body=None):
+        urls.append(url)
+        if url == "http://y/":
+            return {
+                "conformsTo": [
+                    "https://api.stacspec.org/v1.0.0/core",
+                    "https://api.stacspec.org/v1.0.0/item-search#fields",
+                ]
+            }
+        return {"features": [{"assets": {"a": {"href": "http://files/a.tif"}}}]}
+
+    monkeypatch.setattr(sd, "_read_json", fake_read_json)
+    monkeypatch.setattr(sd, "_list_collections_cached", lambda base_url: ("C1",))
+    assert list(sd.iter_asset_filenames("C1", base_url="http://y", limit=1)) == [
+        "a.tif"
+    ]
+    assert urls == ["http://y/", "http://y/collections/C1/items?limit=1"]
+
+
+def test_iter_asset_filenames_survives_failed_fields_probe(monkeypatch):
+    def fake_urlopen(req):
+        if req.full_url == "http://y/":
+            raise urllib.error.URLError("refused")
+        payload = {"features": [{"assets": {"a": {"href": "http://files/a.tif"}}}]}
+        return FakeResponse(json.dumps(payload).encode(), {})
+
+    monkeypatch.setattr(sd.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(sd, "_list_collections_cached", lambda base_url: ("C1",))
+    assert list(sd.iter_asset_filenames("C1", base_url="http://y", limit=1)) == [
+        "a.tif"
+    ]
+
+
+def test_sample_collection_filenames_probes_fields_once(monkeypatch):
+    probes = []
+
+    def fake_read_json(url, *, body=None):
+        if url == "http://y/":
+            probes.append(url)
+            time.sleep(0.01)
+            return {"conformsTo": []}
+        return {"features": [{"assets": {"a": {"href": "http://files/a.tif"}}}]}
+
+    leaves = [f"C{i}" for i in range(8)]
+    monkeypatch.setattr(sd, "_read_json", fake_read_json)
+    monkeypatch.setattr(sd, "_list_collections_cached", lambda base_url: tuple(leaves))
+    monkeypatch.setattr(
+        sd, "iter_leaf_collections", lambda collection_id, *, base_url: iter(leaves)
+    )
+    out = sd.sample_collection_filenames("ROOT", 1, base_url="http://y")
+    assert out == {cid: ["a.tif"] for cid in leaves}
+    assert probes == ["http://y/"]
+
+
+def test_iter_asset_filenames_follows_post_next_link(monkeypatch):
+    calls = []
+
+    def fake_read_json(url, *, body=None):
+        calls.append((url, body))
+        if body is None:
+            return {
+                "features": [{"assets": {"a": {"href": "http://files/a.tif"}}}],
+                "links": [
+                    {"rel": "self", "href": url},
+                    {
+                        "rel": "next",
+                        "href": "http://y/search",
+                        "method": "POST",
+                        "body": {"token": "next:2"},
+                    },
+                ],
+            }
+        return {
+            "features": [{"assets": {"b": {"href": "http://files/b.tif"}}}],
+            "links": [],
+        }
+
+    monkeypatch.setattr(sd, "_read_json", fake_read_json)
+    monkeypatch.setattr(sd, "_list_collections_cached", lambda base_url: ("C1",))
+    monkeypatch.setattr(sd, "_supports_fields", lambda base_url: False)
+    out = list(sd.iter_asset_filenames("C1", base_url="http://y", limit=5))
+    assert out == ["a.tif", "b.tif"]
+    assert calls == [
+        ("http://y/collections/C1/items?limit=5", None),
+        ("http://y/search", {"token": "next:2"}),
+    ]
+
+
 def test_iter_asset_filenames_resolves_templates(monkeypatch):
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         return {
             "features": [
                 {
@@ -117,7 +300,7 @@ def test_iter_asset_filenames_resolves_templates(monkeypatch):
 
 
 def test_iter_asset_filenames_uses_title(monkeypatch):
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         return {
             "features": [
                 {
@@ -137,7 +320,7 @@ def test_iter_asset_filenames_uses_title(monkeypatch):
 
 
 def test_iter_asset_filenames_odata_href(monkeypatch):
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         return {
             "features": [
                 {
@@ -156,7 +339,7 @@ def test_iter_asset_filenames_odata_href(monkeypatch):
 
 
 def test_iter_asset_filenames_strips_query_and_fragment(monkeypatch):
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         return {
             "features": [
                 {
@@ -178,7 +361,7 @@ def test_iter_asset_filenames_strips_query_and_fragment(monkeypatch):
 
 
 def test_iter_asset_filenames_sanitizes(monkeypatch):
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         return {
             "features": [
                 {
@@ -198,7 +381,7 @@ def test_iter_asset_filenames_sanitizes(monkeypatch):
 def test_iter_asset_filenames_generic_title_uses_href(monkeypatch):
     """Assets with a generic title should fall back to the href."""
 
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         return {
             "features": [
                 {
@@ -218,7 +401,7 @@ def test_iter_asset_filenames_generic_title_uses_href(monkeypatch):
 
 
 def test_iter_asset_filenames_skips_value_href(monkeypatch):
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         return {
             "features": [
                 {
@@ -235,25 +418,88 @@ def test_iter_asset_filenames_skips_value_href(monkeypatch):
     assert out == ["file.tif"]
 
 
+def test_fetch_asset_filenames_returns_limited_list(monkeypatch):
+    def fake_iter_asset(collection_id, *, base_url, limit, asset_role=None):
+        yield from ["a", "b", "c"]
+
+    monkeypatch.setattr(sd, "iter_asset_filenames", fake_iter_asset)
+    assert sd.fetch_asset_filenames("C1", base_url="http://y", limit=2) == [
+        "a",
+        "b",
+    ]
+
+
+def test_iter_asset_filenames_skips_duplicates(monkeypatch):
+    def fake_read_json(url, *, body=None):
+        return {
+            "features": [
+                {
+                    "assets": {
+                        "PRODUCT": {"href": "http://files/a.tif"},
+                        "visual": {"href": "http://mirror/a.tif"},
+                        "other": {"href": "http://files/b.tif"},
+                    }
+                },
+                {"assets": {"data": {"href": "http://files/a.tif"}}},
+            ]
+        }
+
+    monkeypatch.setattr(sd, "_read_json", fake_read_json)
+    out = list(sd.iter_asset_filenames("C1", base_url="http://y", limit=2))
+    assert out == ["a.tif", "b.tif"]
+
+
+def test_iter_asset_filenames_repeated_titles_do_not_exhaust_pages(monkeypatch):
+    urls = []
+
+    def fake_read_json(url, *, body=None):
+        urls.append(url)
+        page = len(urls)
+        feature = {
+            "assets": {
+                "B04": {"title": "Red (band 4)", "href": f"http://f/{page}_B04.tif"},
+                "thumb": {"title": "Thumbnail", "href": f"http://f/{page}.png"},
+            }
+        }
+        return {
+            "features": [feature, feature],
+            "links": [{"rel": "next", "href": f"http://y/page{page + 1}"}],
+        }
+
+    monkeypatch.setattr(sd, "_read_json", fake_read_json)
+    monkeypatch.setattr(sd, "_supports_fields", lambda base_url: False)
+    out = list(sd.iter_asset_filenames("C1", base_url="http://y", limit=5))
+    assert out == [
+        "Red__band_4_",
+        "Thumbnail",
+        "Red__band_4_",
+        "Thumbnail",
+        "Red__band_4_",
+    ]
+    assert len(urls) == 2
+
+
 def test_sample_collection_filenames_custom_base_url(monkeypatch):
     called = {}
 
-    def fake_iter_tree(collection_id, *, base_url, limit, asset_role=None):
+    def fake_leaves(collection_id, *, base_url):
         called["collection"] = collection_id
         called["base_url"] = base_url
+        yield collection_id
+
+    def fake_iter_asset(collection_id, *, base_url, limit, asset_role=None):
         called["limit"] = limit
         called["asset_role"] = asset_role
-        yield (collection_id, "f1")
-        yield (collection_id, "f2")
-        yield (collection_id, "f3")
+        yield from ["f1", "f2", "f3"]
 
-    monkeypatch.setattr(sd, "iter_collection_tree", fake_iter_tree)
+    monkeypatch.setattr(sd, "iter_leaf_collections", fake_leaves)
+    monkeypatch.setattr(sd, "iter_asset_filenames", fake_iter_asset)
     res = sd.sample_collection_filenames(
         "COL", 2, base_url="http://z", asset_role="data"
     )
     assert called == {
         "collection": "COL",
-        "base_url": "http://z",
+        "base_url": "http://z/",
         "limit": 2,
         "asset_role": "data",
     }
@@ -313,12 +559,13 @@ def test_sample_collection_filenames_nested(monkeypatch):
         return fake_iter_asset(collection_id, base_url=base_url, limit=limit)
 
     monkeypatch.setattr(sd, "iter_asset_filenames", fake_iter_asset_role)
+    monkeypatch.setattr(sd, "_supports_fields", lambda base_url: False)
     res = sd.sample_collection_filenames("ROOT", 1, base_url="http://x")
     assert res == {"C1": ["a1"], "C3": ["c1"]}
 
 
 def test_iter_asset_filenames_filters_role(monkeypatch):
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         return {
             "features": [
                 {
@@ -340,22 +587,93 @@ def test_iter_asset_filenames_filters_role(monkeypatch):
 def test_sample_collection_filenames_forwards_asset_role(monkeypatch):
     called = {}
 
-    def fake_iter_tree(collection_id, *, base_url, limit, asset_role=None):
+    def fake_iter_asset(collection_id, *, base_url, limit, asset_role=None):
         called["asset_role"] = asset_role
-        yield (collection_id, "f")
+        yield "f"
 
-    monkeypatch.setattr(sd, "iter_collection_tree", fake_iter_tree)
+    monkeypatch.setattr(sd, "iter_leaf_collections", lambda cid, *, base_url: [cid])
+    monkeypatch.setattr(sd, "iter_asset_filenames", fake_iter_asset)
     sd.sample_collection_filenames("COL", base_url="http://x", asset_role="data")
     assert called["asset_role"] == "data"
 
 
+def test_iter_collection_tree_walks_leaves_in_order(monkeypatch):
+    collections = {
+        "ROOT": [
+            {"rel": "child", "href": "collections/C1/"},
+            {"rel": "child", "href": "collections/C2"},
+        ],
+        "C1": [],
+        "C2": [{"rel": "child", "href": "collections/C3"}],
+        "C3": [],
+    }
+
+    monkeypatch.setattr(
+        sd, "_read_json", lambda url: {"links": collections[url.split("/")[-1]]}
+    )
+    monkeypatch.setattr(
+        sd, "_list_collections_cached", lambda base_url: tuple(collections)
+    )
+
+    def fake_iter_asset(collection_id, *, base_url, limit, asset_role=None):
+        yield f"{collection_id}.tif"
+
+    monkeypatch.setattr(sd, "iter_asset_filenames", fake_iter_asset)
+    out = list(sd.iter_collection_tree("ROOT", base_url="http://x"))
+    assert out == [("C1", "C1.tif"), ("C3", "C3.tif")]
+
+
+def test_iter_leaf_collections_is_cached(monkeypatch):
+    collections = {
+        "ROOT": [{"rel": "child", "href": "collections/C1"}],
+        "C1": [],
+    }
+    urls = []
+
+    def fake_read_json(url):
+        urls.append(url)
+        return {"links": collections[url.split("/")[-1]]}
+
+    monkeypatch.setattr(sd, "_read_json", fake_read_json)
+    monkeypatch.setattr(
+        sd, "_list_collections_cached", lambda base_url: tuple(collections)
+    )
+    assert list(sd.iter_leaf_collections("ROOT", base_url="http://x")) == ["C1"]
+    assert list(sd.iter_leaf_collections("ROOT", base_url="http://x/")) == ["C1"]
+    assert urls == ["http://x/collections/ROOT", "http://x/collections/C1"]
+
+
+def test_iter_leaf_collections_visits_shared_children_once(monkeypatch):
+    collections = {
+        "ROOT": [
+            {"rel": "child", "href": "collections/A"},
+            {"rel": "child", "href": "collections/B"},
+        ],
+        "A": [{"rel": "child", "href": "collections/SHARED"}],
+        "B": [{"rel": "child", "href": "collections/SHARED/"}],
+        "SHARED": [],
+    }
+    urls = []
+
+    def fake_read_json(url):
+        urls.append(url)
+        return {"links": collections[url.split("/")[-1]]}
+
+    monkeypatch.setattr(sd, "_read_json", fake_read_json)
+    monkeypatch.setattr(
+        sd, "_list_collections_cached", lambda base_url: tuple(collections)
+    )
+    assert list(sd.iter_leaf_collections("ROOT", base_url="http://x")) == ["SHARED"]
+    assert urls.count("http://x/collections/SHARED") == 1
+
+
 def test_list_collections_requires_base_url():
     with pytest.raises(TypeError):
         sd.list_collections_http()
 
 
 def test_iter_asset_filenames_bad_collection(monkeypatch):
-    def fake_read_json(url):
+    def fake_read_json(url, *, body=None):
         raise urllib.error.HTTPError(url, 404, "Not Found", None, None)
 
     monkeypatch.setattr(sd, "_read_json", fake_read_json)
@@ -396,3 +714,130 @@ def test_list_collections_cached_deep(monkeypatch):
     sd._list_collections_cached("http://x")
     assert called["deep"] is True
 
+
+
+class FakeResponse(io.BytesIO):
+    def __init__(self, body, headers):
+        super().__init__(body)
+        self.headers = headers
+
+
+@pytest.mark.parametrize("encoding", [None, "gzip"])
+def test_read_json_requests_and_decodes_gzip(monkeypatch, encoding):
+    seen = {}
+    body = json.dumps({"id": "abc"}).encode("utf-8")
+    headers = {}
+    if encoding:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = encoding
+
+    def fake_urlopen(req):
+        seen["url"] = req.full_url
+        seen["accept"] = req.get_header("Accept-encoding")
+        return FakeResponse(body, headers)
+
+    monkeypatch.setattr(sd.urllib.request, "urlopen", fake_urlopen)
+    assert sd._read_json("http://x/collections/abc") == {"id": "abc"}
+    assert seen == {"url": "http://x/collections/abc", "accept": "gzip"}
+
+
+def test_read_json_posts_body(monkeypatch):
+    seen = {}
+
+    def fake_urlopen(req):
+        seen["method"] = req.get_method()
+        seen["data"] = json.loads(req.data)
+        seen["type"] = req.get_header("Content-type")
+        return FakeResponse(b"{}", {})
+
+    monkeypatch.setattr(sd.urllib.request, "urlopen", fake_urlopen)
+    assert sd._read_json("http://x/search", body={"limit": 1}) == {}
+    assert seen == {
+        "method": "POST",
+        "data": {"limit": 1},
+        "type": "application/json",
+    }
+
+
+def test_read_json_retries_transient_errors(monkeypatch):
+    attempts = []
+    sleeps = []
+
+    def fake_urlopen(req):
+        attempts.append(req.full_url)
+        if len(attempts) == 1:
+            raise urllib.error.HTTPError(
+                req.full_url, 429, "Too Many Requests", {"Retry-After": "3"}, None
+            )
+        if len(attempts) == 2:
+            raise urllib.error.HTTPError(req.full_url, 503, "Unavailable", {}, None)
+        return FakeResponse(b'{"ok": true}', {})
+
+    monkeypatch.setattr(sd.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(sd.time, "sleep", sleeps.append)
+    assert sd._read_json("http://x/collections") == {"ok": True}
+    assert len(attempts) == 3
+    assert sleeps[0] == 3.0
+    assert 0 <= sleeps[1] <= sd._BACKOFF_FACTOR * 2
+
+
+def test_read_json_gives_up_after_max_retries(monkeypatch):
+    attempts = []
+
+    def fake_urlopen(req):
+        attempts.append(req.full_url)
+        raise urllib.error.HTTPError(req.full_url, 502, "Bad Gateway", {}, None)
+
+    monkeypatch.setattr(sd.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(sd.time, "sleep", lambda delay: None)
+    with pytest.raises(urllib.error.HTTPError):
+        sd._read_json("http://x/collections")
+    assert len(attempts) == sd._MAX_RETRIES + 1
+
+
+def test_read_json_propagates_not_found(monkeypatch):
+    attempts = []
+
+    def fake_urlopen(req):
+        attempts.append(req.full_url)
+        raise urllib.error.HTTPError(req.full_url, 404, "Not Found", {}, None)
+
+    monkeypatch.setattr(sd.urllib.request, "urlopen", fake_urlopen)
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        sd._read_json("http://x/collections/BAD")
+    assert exc.value.code == 404
+    assert len(attempts) == 1
+
+
+def test_read_json_does_not_sleep_on_huge_retry_after(monkeypatch):
+    attempts = []
+    sleeps = []
+
+    def fake_urlopen(req):
+        attempts.append(req.full_url)
+        raise urllib.error.HTTPError(
+            req.full_url, 503, "Unavailable", {"Retry-After": "86400"}, None
+        )
+
+    monkeypatch.setattr(sd.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(sd.time, "sleep", sleeps.append)
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        sd._read_json("http://x/collections")
+    assert exc.value.code == 503
+    assert len(attempts) == 1
+    assert sleeps == []
+
+
+def test_retry_delay_accepts_http_date():
+    from datetime import datetime
+    from datetime import timedelta
+    from datetime import timezone
+    from email.utils import format_datetime
+
+    def err_for(delta):
+        when = format_datetime(datetime.now(timezone.utc) + delta, usegmt=True)
+        headers = {"Retry-After": when}
+        return urllib.error.HTTPError("http://x", 503, "Unavailable", headers, None)
+
+    assert 0 <= sd._retry_delay(0, err_for(timedelta(seconds=5))) <= 5
+    assert sd._retry_delay(0, err_for(timedelta(days=1))) is None
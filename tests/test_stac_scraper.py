@@ -1,3 +1,4 @@
+import io
 import sys
 import types
 
@@ -52,6 +53,27 @@ class FakeClientSearch(FakeClient):
         return FakeSearch()
 
 
+def _fake_requests(get, **attrs):
+    """Return a stand-in ``requests`` module whose sessions call ``get``."""
+
+    class FakeSession:
+        def mount(self, prefix, adapter):
+            pass
+
+        def get(self, url, stream=False, timeout=None):
+            return get(url, stream=stream)
+
+    adapters = types.SimpleNamespace(HTTPAdapter=lambda **kwargs: object())
+    return types.SimpleNamespace(Session=FakeSession, adapters=adapters, **attrs)
+
+
+@pytest.fixture(autouse=True)
+def _reset_state(monkeypatch):
+    monkeypatch.setattr(ss, "_SESSION", None)
+    ss._list_collections_client_cached.cache_clear()
+    yield
+    ss._list_collections_client_cached.cache_clear()
+
 
 def test_list_collections_client(monkeypatch):
     fake_pc = types.SimpleNamespace(Client=FakeClient)
@@ -61,11 +83,46 @@ def test_list_collections_client(monkeypatch):
 
 
 
+def test_list_collections_client_deep(monkeypatch):
+    opened = []
+    tree = {
+        "http://base": (["A"], ["http://base/c1", "http://base/c2"]),
+        "http://base/c1": (["B"], ["http://base/c2"]),
+        "http://base/c2": (["C"], []),
+    }
+
+    class TreeClient:
+        def __init__(self, url):
+            self.url = url
+
+        @staticmethod
+        def open(url):
+            opened.append(url)
+            return TreeClient(url)
+
+        def get_collections(self):
+            return [FakeCollection(cid) for cid in tree[self.url][0]]
+
+        def get_children(self):
+            return [types.SimpleNamespace(href=h) for h in tree[self.url][1]]
+
+    fake_pc = types.SimpleNamespace(Client=TreeClient)
+    monkeypatch.setitem(sys.modules, "pystac_client", fake_pc)
+    assert ss.list_collections_client("http://base", deep=True) == ["A", "B", "C"]
+    assert sorted(opened) == ["http://base", "http://base/c1", "http://base/c2"]
+
+    # Repeated listings are served from the cache.
+    assert ss.list_collections_client("http://base", deep=True) == ["A", "B", "C"]
+    assert len(opened) == 3
+
+
 def test_search_stac_and_download(monkeypatch, tmp_path):
     fake_pc = types.SimpleNamespace(Client=FakeClientSearch)
     monkeypatch.setitem(sys.modules, "pystac_client", fake_pc)
 
     class FakeResp:
+        raw = io.BytesIO(b"data")
+
         def __enter__(self):
             return self
 
@@ -75,14 +132,11 @@ def test_search_stac_and_download(monkeypatch, tmp_path):
         def raise_for_status(self):
             pass
 
-        def iter_content(self, chunk_size=8192):
-            yield b"data"
-
     def fake_get(url, stream=True):
         assert url == "http://example.com/file.bin"
         return FakeResp()
 
-    fake_requests = types.SimpleNamespace(get=fake_get)
+    fake_requests = _fake_requests(fake_get)
     monkeypatch.setitem(sys.modules, "requests", fake_requests)
 
     dest = tmp_path / "dl"
@@ -95,6 +149,138 @@ def test_search_stac_and_download(monkeypatch, tmp_path):
     )
     assert path == dest / "file.bin"
     assert path.read_bytes() == b"data"
+    assert FakeResp.raw.decode_content is True
+
+
+def test_download_session_is_reused(monkeypatch):
+    created = []
+
+    class FakeSession:
+        def __init__(self):
+            created.append(self)
+            self.mounted = []
+
+        def mount(self, prefix, adapter):
+            self.mounted.append(prefix)
+
+    fake_requests = types.SimpleNamespace(
+        Session=FakeSession,
+        adapters=types.SimpleNamespace(HTTPAdapter=lambda **kwargs: kwargs),
+    )
+    first = ss._get_session(fake_requests)
+    assert ss._get_session(fake_requests) is first
+    assert created == [first]
+    assert first.mounted == ["http://", "https://"]
+
+
+def test_search_stac_and_download_many(monkeypatch, tmp_path):
+    class MultiItem:
+        id = "ITEM/1"
+        properties = {}
+
+        def __init__(self):
+            self.assets = {
+                "a": FakeAsset("http://example.com/a.bin"),
+                "b": FakeAsset("http://example.com/missing.bin"),
+                "c": FakeAsset("http://mirror.com/a.bin"),
+                "d": FakeAsset("http://example.com/a.bin", title="Product"),
+                "e": FakeAsset("http://example.com/down.bin"),
+            }
+
+    class MultiSearch:
+        def items(self):
+            yield MultiItem()
+            yield types.SimpleNamespace(
+                id="ITEM2",
+                properties={},
+                assets={
+                    "p": FakeAsset("http://example.com/x/data.bin", title="Product"),
+                    "q": FakeAsset("http://example.com/y/data.bin", title="Product"),
+                },
+            )
+
+    searches = []
+
+    class MultiClient(FakeClientSearch):
+        @staticmethod
+        def open(url):
+            return MultiClient()
+
+        def search(self, **kwargs):
+            searches.append(kwargs)
+            return MultiSearch()
+
+    fake_pc = types.SimpleNamespace(Client=MultiClient)
+    monkeypatch.setitem(sys.modules, "pystac_client", fake_pc)
+
+    class RequestException(Exception):
+        pass
+
+    class HTTPError(RequestException):
+        pass
+
+    class ConnectionError(RequestException):
+        pass
+
+    requested = []
+
+    class FakeResp:
+        def __init__(self, url):
+            self.url = url
+            self.raw = io.BytesIO(url.encode())
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            pass
+
+        def raise_for_status(self):
+            if "missing" in self.url:
+                raise HTTPError("404")
+
+    def fake_get(url, stream=True):
+        requested.append(url)
+        if "down" in url:
+            raise ConnectionError("reset")
+        return FakeResp(url)
+
+    monkeypatch.setitem(
+        sys.modules,
+        "requests",
+        _fake_requests(
+            fake_get, HTTPError=HTTPError, RequestException=RequestException
+        ),
+    )
+
+    dest = tmp_path / "dl"
+    results = ss.search_stac_and_download_many(
+        stac_url="http://base",
+        collections=["C"],
+        bbox=[0, 0, 1, 1],
+        datetime="2024",
+        dest_dir=dest,
+        limit=2,
+    )
+    assert searches[0]["max_items"] == 2
+    item1 = dest / "ITEM_1"
+    item2 = dest / "ITEM2"
+    assert results[0] == item1 / "a.bin"
+    assert isinstance(results[1], HTTPError)
+    # Same basename from another host gets a distinct name, not dropped.
+    assert results[2] == item1 / "a_1.bin"
+    assert isinstance(results[3], ConnectionError)
+    assert results[4:] == [item2 / "data.bin", item2 / "data_1.bin"]
+    assert (item1 / "a_1.bin").read_bytes() == b"http://mirror.com/a.bin"
+    assert (item2 / "data_1.bin").read_bytes() == b"http://example.com/y/data.bin"
+    assert sorted(requested) == [
+        "http://example.com/a.bin",
+        "http://example.com/down.bin",
+        "http://example.com/missing.bin",
+        "http://example.com/x/data.bin",
+        "http://example.com/y/data.bin",
+        "http://mirror.com/a.bin",
+    ]
 
 
 def test_search_stac_and_download_http_error(monkeypatch, tmp_path):
@@ -114,13 +300,10 @@ def test_search_stac_and_download_http_error(monkeypatch, tmp_path):
         def raise_for_status(self):
             raise HTTPError("404")
 
-        def iter_content(self, chunk_size=8192):
-            yield b"data"
-
     def fake_get(url, stream=True):
         return FakeResp()
 
-    fake_requests = types.SimpleNamespace(get=fake_get, HTTPError=HTTPError)
+    fake_requests = _fake_requests(fake_get, HTTPError=HTTPError)
     monkeypatch.setitem(sys.modules, "requests", fake_requests)
 
     with pytest.raises(FileNotFoundError):
@@ -0,0 +1,16 @@
+from parseo.template import compile_template
+
+
+def test_compile_template_is_cached_per_spec():
+    fields = {"a": {"enum": ["X", "Y"]}, "b": {"pattern": "^\\d{2}$"}}
+    pattern, order = compile_template("{a}_{b}[.{c}]", fields)
+    assert pattern == "^(?P<a>(?:X|Y))_(?P<b>\\d{2})(?:\\.(?P<c>.+))?$"
+    assert order == ["a", "b", "c"]
+
+    # Callers may mutate the returned order without affecting the cache.
+    order.append("z")
+    assert compile_template("{a}_{b}[.{c}]", dict(fields))[1] == ["a", "b", "c"]
+
+    # A different spec for the same template yields a different pattern.
+    other, _ = compile_template("{a}_{b}[.{c}]", {"a": {"enum": ["Z"]}})
+    assert other != pattern